@@ -17,10 +17,8 @@ Future Iterations to Consider:
 ------------------------------
 
 1. MEMORY RETRIEVAL (High Priority)
-   - Current: Simple top-k embedding similarity
+   - Current: Hybrid top-k (vector index + BM25 full-text, fused with RRF)
    - Future:
-     * Hybrid search (embedding + keyword/BM25)
-     * Temporal weighting (recent memories more relevant)
      * Usage tracking (frequently useful memories bubble up)
      * Memory consolidation (merge similar memories)
      * Episodic vs semantic memory distinction
@@ -28,9 +26,9 @@ Future Iterations to Consider:
      * Forgetting curve simulation
 
 2. CONTEXT WINDOW OPTIMIZATION
-   - Current: Fixed token budget per category
+   - Current: Per-turn budget derived from the model context window and
+     a rough complexity estimate, enforced by estimated token counts
    - Future:
-     * Dynamic budget based on conversation complexity
      * Sliding context window with summarization
      * Hierarchical summarization of old context
      * Smart truncation (keep important parts)
@@ -44,10 +42,9 @@ Future Iterations to Consider:
      * Entity-based retrieval (mentioned people/projects)
 
 4. CACHING
-   - Current: None
+   - Current: LRU cache of query embeddings, short-lived semantic
+     cache of retrieved context for paraphrased queries
    - Future:
-     * Cache embeddings for common queries
-     * Cache retrieved context for conversation continuity
      * Invalidate on memory updates
 
 5. PREFERENCE LEARNING
@@ -74,27 +71,138 @@ Future Iterations to Consider:
 
 TODOs for immediate improvement:
 --------------------------------
-- [ ] Add embedding cache
+- [x] Add embedding cache (see embedding_cache.py)
 - [ ] Implement memory usage tracking
-- [ ] Add temporal decay to memory retrieval
+- [x] Add temporal decay to memory retrieval
 - [ ] Support entity-based memory lookup
 - [ ] Add preference confidence thresholds
 """
 
 import os
-from typing import Optional, List, Dict, Any
-from dataclasses import dataclass, field
+import math
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Optional, List, Dict, Any, Literal, Tuple
+from dataclasses import dataclass, field, replace
 from datetime import datetime
 
+from .embedding_cache import EmbeddingCache
+
+logger = logging.getLogger(__name__)
+
+
+# Name of the Neo4j vector index over Memory.embedding
+MEMORY_VECTOR_INDEX = "memory_embedding"
+
+# Name of the Neo4j full-text (BM25) index over Memory.content/name
+MEMORY_TEXT_INDEX = "memory_text"
+
+# Reciprocal Rank Fusion constant for hybrid retrieval
+RRF_K = 60
+
+RetrievalMode = Literal["vector", "bm25", "hybrid"]
+
+Complexity = Literal["simple", "moderate", "complex"]
+
+# Context windows by model id substring (tokens)
+MODEL_CONTEXT_WINDOWS = {"claude": 200_000}
+DEFAULT_CONTEXT_WINDOW = 200_000
+
+# Share of the free context window given to retrieved context
+COMPLEXITY_SHARE = {"simple": 0.01, "moderate": 0.02, "complex": 0.05}
+
+CHARS_PER_TOKEN = 4
+
+# Max texts per embed_batch call (Voyage's 128 is the smallest provider limit)
+EMBED_BATCH_SIZE = 128
+
+# Semantic context cache: a paraphrased query (cosine >= threshold) within
+# the TTL reuses the previously retrieved context instead of hitting Neo4j
+CONTEXT_CACHE_SIZE = 64
+CONTEXT_CACHE_TTL = 60.0
+CONTEXT_CACHE_THRESHOLD = 0.95
+
+# Characters with special meaning in Lucene query syntax
+_LUCENE_SPECIAL = set('+-&|!(){}[]^"~*?:\\/')
+
+
+def _is_missing_index_error(error: Exception) -> bool:
+    """
+    Whether a Neo4j error means the vector/full-text index or its
+    procedure isn't there (as opposed to a transient or per-query error).
+    """
+    code = getattr(error, "code", None) or ""
+    if code in ("Neo.ClientError.Procedure.ProcedureNotFound",
+                "Neo.ClientError.Schema.IndexNotFound"):
+        return True
+    # db.index.*.queryNodes on an unknown index: "There is no such ... index"
+    message = str(getattr(error, "message", None) or error).lower()
+    return code == "Neo.ClientError.Procedure.ProcedureCallFailed" and "no such" in message
+
+
+def _escape_lucene(text: str) -> str:
+    """Escape user text for use as a literal Lucene full-text query."""
+    return "".join("\\" + c if c in _LUCENE_SPECIAL else c for c in text)
+
+
+def _quantize_int8(vec) -> Tuple[bytes, float]:
+    """
+    Symmetric per-vector int8 quantization.
+
+    Returns (q8, scale) with vec ~= q8 * scale, q8 packed as raw int8
+    bytes. Stored next to the float embedding so the fallback search
+    ships ~1.5KB per 1536-d memory instead of ~12KB.
+    """
+    import numpy as np
+
+    vec = np.asarray(vec, dtype=np.float32)
+    peak = float(np.max(np.abs(vec)))
+    if peak == 0.0:
+        return bytes(len(vec)), 0.0
+    q8 = np.round(vec / peak * 127).astype(np.int8)
+    return q8.tobytes(), peak / 127
+
+
+def _as_vector(value, dtype):
+    """
+    Stored embedding -> 1-d array.
+
+    Byte-array properties (embedding_q8) are viewed in place with
+    np.frombuffer; list properties (the raw embedding) are converted.
+    """
+    import numpy as np
+
+    if isinstance(value, (bytes, bytearray)):
+        return np.frombuffer(value, dtype=dtype)
+    return np.asarray(value, dtype=dtype)
+
+
+# Static fragments of the context system prompt
+_VALUES_HDR = "Core values: "
+_STYLE_HDR = "Communication style: "
+_TRAITS_HDR = "Personality traits:"
+_MEMORIES_HDR = "Relevant memories/observations:"
+_PREFERENCES_HDR = "User preferences:"
+
+
+async def _no_memories() -> tuple[List[Dict[str, Any]], int]:
+    """Placeholder memory fetch for queries without text."""
+    return [], 0
+
 
 @dataclass
 class ContextBudget:
     """
     Token budget for different context categories.
 
-    ITERATION NOTE: These are rough estimates. Future versions should:
-    - Dynamically adjust based on conversation needs
-    - Actually count tokens instead of estimating
+    The defaults are a static fallback and define the relative split
+    between sections; derive_budget() scales them to the model's
+    context window and the turn's complexity.
+
+    ITERATION NOTE: Future versions should:
+    - Actually count tokens instead of estimating (chars / 4)
     - Allow user/admin configuration
     """
     core_identity: int = 500      # Name, tagline, values, style
@@ -110,6 +218,79 @@ class ContextBudget:
                 self.preferences + self.project_context + self.user_context)
 
 
+def estimate_tokens(text: str) -> int:
+    """Fast token estimate (~4 chars per token), no tokenizer round trip."""
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+
+def classify_complexity(message: str) -> Complexity:
+    """Rough turn complexity from the length of the user's message."""
+    tokens = estimate_tokens(message or "")
+    if tokens < 30:
+        return "simple"
+    if tokens > 300:
+        return "complex"
+    return "moderate"
+
+
+def derive_budget(
+    model: Optional[str] = None,
+    system_tokens: int = 0,
+    tool_tokens: int = 0,
+    current_turn_tokens: int = 0,
+    complexity: Complexity = "moderate"
+) -> ContextBudget:
+    """
+    Derive a per-turn context budget from the model's context window.
+
+    Args:
+        model: Model id (used to look up the context window)
+        system_tokens: Fixed system prompt overhead
+        tool_tokens: Tokens used by tool definitions
+        current_turn_tokens: Tokens in the conversation so far, incl. this message
+        complexity: "simple", "moderate" or "complex"
+
+    Returns:
+        ContextBudget whose per-query sections (memories, preferences)
+        share COMPLEXITY_SHARE[complexity] of 90% of the free window, never
+        less than their defaults. The static sections keep their defaults
+        so the prompt-cached prefix doesn't change from turn to turn.
+    """
+    window = DEFAULT_CONTEXT_WINDOW
+    for prefix, size in MODEL_CONTEXT_WINDOWS.items():
+        if model and prefix in model:
+            window = size
+            break
+
+    free = max(0, window - system_tokens - tool_tokens - current_turn_tokens) * 0.9
+    total = free * COMPLEXITY_SHARE.get(complexity, COMPLEXITY_SHARE["moderate"])
+
+    budget = ContextBudget()
+    scale = max(1.0, total / (budget.memories + budget.preferences))
+    budget.memories = int(budget.memories * scale)
+    budget.preferences = int(budget.preferences * scale)
+    return budget
+
+
+def _fit_lines(lines, budget_tokens: int) -> List[str]:
+    """
+    Keep lines in order while their estimated tokens fit the budget.
+
+    If even the first line doesn't fit, it is truncated to the budget.
+    """
+    kept = []
+    remaining = budget_tokens
+    for line in lines:
+        cost = estimate_tokens(line)
+        if cost > remaining:
+            if not kept and remaining > 0:
+                kept.append(line[:remaining * CHARS_PER_TOKEN])
+            break
+        kept.append(line)
+        remaining -= cost
+    return kept
+
+
 @dataclass
 class RetrievedContext:
     """
@@ -128,6 +309,9 @@ class RetrievedContext:
     project_context: Optional[Dict[str, Any]] = None
     user_context: Optional[Dict[str, Any]] = None
 
+    # Token budget enforced when rendering (defaults if None)
+    budget: Optional[ContextBudget] = None
+
     # Metadata for debugging/iteration
     retrieval_timestamp: Optional[str] = None
     memory_query_used: Optional[str] = None
@@ -137,68 +321,109 @@ class RetrievedContext:
         """
         Build system prompt from retrieved context.
 
+        Equivalent to joining to_system_prompt_parts(); prefer
+        to_system_blocks() when calling the model so the static part
+        can be prompt-cached.
+        """
+        static, dynamic = self.to_system_prompt_parts()
+        return f"{static}\n\n{dynamic}" if dynamic else static
+
+    def to_system_prompt_parts(self) -> Tuple[str, str]:
+        """
+        Build the system prompt as (static prefix, dynamic suffix).
+
+        The prefix (identity, traits, user, project) is stable across turns
+        so LLM prompt caches keyed on the prefix keep hitting; the suffix
+        holds the per-query memories and preferences.
+
+        Traits, memories and preferences are cut to the token budget
+        (self.budget, or ContextBudget defaults).
+
         ITERATION NOTE: This is a simple template. Future versions could:
         - Use dynamic templates based on conversation type
-        - Adjust verbosity based on available budget
         - Include/exclude sections based on relevance
         """
+        identity = self.core_identity
+        g = identity.get
+        budget = self.budget or ContextBudget()
         sections = []
+        append = sections.append
 
         # Core identity (always included)
-        identity = self.core_identity
-        name = identity.get('name', 'Assistant')
-        tagline = identity.get('tagline', 'your helpful companion')
+        name = g('name', 'Assistant')
+        append(f"You are {name}, {g('tagline', 'your helpful companion')}.")
 
-        sections.append(f"You are {name}, {tagline}.")
-
-        if identity.get('personality_summary'):
-            sections.append(identity['personality_summary'])
+        summary = g('personality_summary')
+        if summary:
+            append(summary)
 
         # Values
-        values = identity.get('core_values', [])
+        values = g('core_values')
         if values:
-            sections.append(f"Core values: {', '.join(values)}")
+            append(_VALUES_HDR + ', '.join(values))
 
         # Communication style
-        style = identity.get('communication_style', 'conversational')
-        sections.append(f"Communication style: {style}")
+        append(_STYLE_HDR + g('communication_style', 'conversational'))
 
-        # Traits
+        # Traits (strongest first, as many as the budget allows)
         if self.traits:
-            trait_lines = [f"- {t.get('name', 'Unknown')}: {t.get('description', '')}"
-                         for t in self.traits[:5]]  # Limit to top 5
-            sections.append("Personality traits:\n" + "\n".join(trait_lines))
-
-        # Memories (contextually retrieved)
-        # ITERATION NOTE: This is where smart retrieval matters most
-        if self.memories:
-            memory_lines = []
-            for m in self.memories[:3]:  # Limit to top 3 most relevant
-                content = m.get('content', '')[:200]  # Truncate long memories
-                memory_lines.append(f"- {content}")
-            sections.append("Relevant memories/observations:\n" + "\n".join(memory_lines))
-
-        # Preferences
-        if self.preferences:
-            pref_lines = [f"- {p.get('name', '')}: {p.get('value', '')}"
-                        for p in self.preferences[:5]]
-            sections.append("User preferences:\n" + "\n".join(pref_lines))
+            lines = _fit_lines(
+                (f"- {t.get('name', 'Unknown')}: {t.get('description', '')}" for t in self.traits),
+                budget.traits
+            )
+            if lines:
+                append(_TRAITS_HDR + "\n" + "\n".join(lines))
 
         # User context
         if self.user_context:
-            user_name = self.user_context.get('name', 'the user')
-            sections.append(f"You are assisting {user_name}.")
+            append(f"You are assisting {self.user_context.get('name', 'the user')}.")
 
         # Project context
         if self.project_context:
-            proj_name = self.project_context.get('name', 'Unknown')
-            proj_desc = self.project_context.get('description', '')[:200]
-            sections.append(f"Current project: {proj_name}\n{proj_desc}")
+            proj = self.project_context.get
+            desc = proj('description', '')[:budget.project_context * CHARS_PER_TOKEN]
+            append(f"Current project: {proj('name', 'Unknown')}\n{desc}")
 
         # Identity reminder
-        sections.append(f"\nRemember: You ARE {name}. Speak authentically as yourself.")
+        append(f"\nRemember: You ARE {name}. Speak authentically as yourself.")
+
+        static = "\n\n".join(sections)
+        sections = []
+        append = sections.append
+
+        # Memories (contextually retrieved, most relevant first, within budget)
+        # ITERATION NOTE: This is where smart retrieval matters most
+        if self.memories:
+            lines = _fit_lines(
+                ("- " + m.get('content', '') for m in self.memories),
+                budget.memories
+            )
+            if lines:
+                append(_MEMORIES_HDR + "\n" + "\n".join(lines))
+
+        # Preferences
+        if self.preferences:
+            lines = _fit_lines(
+                (f"- {p.get('name', '')}: {p.get('value', '')}" for p in self.preferences),
+                budget.preferences
+            )
+            if lines:
+                append(_PREFERENCES_HDR + "\n" + "\n".join(lines))
+
+        return static, "\n\n".join(sections)
 
-        return "\n\n".join(sections)
+    def to_system_blocks(self) -> List[Dict[str, Any]]:
+        """
+        Build the system prompt as Anthropic system content blocks.
+
+        The static prefix carries a cache_control breakpoint so repeat
+        turns reuse the cached prefill; the dynamic suffix follows it.
+        """
+        static, dynamic = self.to_system_prompt_parts()
+        blocks = [{"type": "text", "text": static, "cache_control": {"type": "ephemeral"}}]
+        if dynamic:
+            blocks.append({"type": "text", "text": dynamic})
+        return blocks
 
 
 class ContextManager:
@@ -209,6 +434,9 @@ class ContextManager:
     See module docstring for future iteration plans.
     """
 
+    # Seconds before slowly-changing lookups are re-fetched from Neo4j
+    _TTLS = {"traits": 300, "user": 300, "preferences": 60}
+
     def __init__(self, graph=None, embedder=None):
         """
         Initialize context manager.
@@ -221,6 +449,14 @@ class ContextManager:
         self._embedder = embedder
         self._persona_id: Optional[str] = None
         self._core_identity_cache: Optional[Dict[str, Any]] = None
+        # None = not checked yet, True/False = vector index usable
+        self._vector_index_available: Optional[bool] = None
+        self._emb_cache = EmbeddingCache()
+        self._background_tasks: set = set()
+        # key -> (monotonic time fetched, value), see _cached()
+        self._cache: Dict[Any, tuple] = {}
+        # (normalized query vector, context, monotonic time, cache key)
+        self._context_cache: deque = deque(maxlen=CONTEXT_CACHE_SIZE)
 
     @property
     def graph(self):
@@ -253,7 +489,8 @@ class ContextManager:
             query: The user's message (used for memory retrieval)
             project_context: Optional project info to include
             preference_categories: Which preference categories to load
-            budget: Token budget (not enforced in v0.1)
+            budget: Token budget, enforced when rendering the prompt
+                (see derive_budget; ContextBudget defaults if None)
             memory_limit: Max memories to retrieve
 
         Returns:
@@ -265,44 +502,127 @@ class ContextManager:
         - Future: use conversation history for better context
         """
         budget = budget or ContextBudget()
+        categories = preference_categories or ['communication', 'general']
+
+        # 0-1. Embedding the query and resolving the persona (cached after
+        # first load) don't depend on each other, so overlap the two round trips
+        if query:
+            query_embedding, core_identity = await asyncio.gather(
+                self._embed_query(query),
+                self._get_core_identity()
+            )
+        else:
+            query_embedding, core_identity = None, await self._get_core_identity()
+
+        # Reuse context retrieved for a near-identical recent query
+        cache_key = (tuple(categories), memory_limit, repr(project_context))
+        if query_embedding is not None:
+            cached = self._lookup_cached_context(query_embedding, cache_key)
+            if cached is not None:
+                return replace(
+                    cached,
+                    budget=budget,
+                    retrieval_timestamp=datetime.utcnow().isoformat(),
+                    memory_query_used=query[:100]
+                )
+
         context = RetrievedContext(
+            budget=budget,
             retrieval_timestamp=datetime.utcnow().isoformat(),
             memory_query_used=query[:100] if query else None
         )
 
-        # 1. Load core identity (cached after first load)
-        context.core_identity = await self._get_core_identity()
-
-        # 2. Load traits (always, they're small)
-        context.traits = await self._get_traits()
+        # Everything below depends only on the persona id resolved above
+        context.core_identity = core_identity
 
-        # 3. Retrieve relevant memories using embeddings
-        # ITERATION NOTE: This is the key area for improvement
+        # 2-4, 6. Traits, memories, preferences and user context are
+        # independent, so fetch them concurrently
+        # ITERATION NOTE: Memory retrieval is the key area for improvement
         if query:
-            memories, considered = await self._get_relevant_memories(
+            memory_fetch = self._get_relevant_memories(
                 query=query,
-                limit=memory_limit
+                limit=memory_limit,
+                query_embedding=query_embedding
             )
-            context.memories = memories
-            context.memories_considered = considered
-
-        # 4. Load preferences by category
-        categories = preference_categories or ['communication', 'general']
-        context.preferences = await self._get_preferences(categories)
+        else:
+            memory_fetch = _no_memories()
+
+        (
+            context.traits,
+            (context.memories, context.memories_considered),
+            context.preferences,
+            context.user_context,
+        ) = await asyncio.gather(
+            self._get_traits(),
+            memory_fetch,
+            self._get_preferences(categories),
+            self._get_user_context(),
+        )
 
         # 5. Add project context if provided
         context.project_context = project_context
 
-        # 6. Load user context
-        context.user_context = await self._get_user_context()
+        if query_embedding is not None:
+            self._store_cached_context(query_embedding, cache_key, context)
 
         return context
 
+    def _lookup_cached_context(
+        self,
+        query_embedding: List[float],
+        cache_key: tuple
+    ) -> Optional[RetrievedContext]:
+        """
+        Find a fresh cached context whose query is semantically equivalent.
+
+        ITERATION NOTE:
+        - Linear scan is fine at CONTEXT_CACHE_SIZE entries; switch to
+          random-projection (LSH) buckets if the cache grows past ~1k
+        """
+        if not self._context_cache:
+            return None
+
+        import numpy as np
+
+        q = np.asarray(query_embedding, dtype=np.float32)
+        q /= np.linalg.norm(q) + 1e-12
+
+        now = time.monotonic()
+        candidates = [
+            entry for entry in self._context_cache
+            if entry[3] == cache_key
+            and now - entry[2] < CONTEXT_CACHE_TTL
+            and entry[0].shape == q.shape
+        ]
+        if not candidates:
+            return None
+
+        scores = np.stack([entry[0] for entry in candidates]) @ q
+        best = int(np.argmax(scores))
+        if scores[best] >= CONTEXT_CACHE_THRESHOLD:
+            return candidates[best][1]
+        return None
+
+    def _store_cached_context(
+        self,
+        query_embedding: List[float],
+        cache_key: tuple,
+        context: RetrievedContext
+    ):
+        """Remember retrieved context for semantically similar follow-up queries."""
+        import numpy as np
+
+        q = np.asarray(query_embedding, dtype=np.float32)
+        q /= np.linalg.norm(q) + 1e-12
+        self._context_cache.append((q, context, time.monotonic(), cache_key))
+
     async def _get_core_identity(self) -> Dict[str, Any]:
         """
         Get core persona identity.
 
-        Cached because it rarely changes.
+        Cached because it rarely changes. The first load also fetches the
+        persona's traits in the same query and primes the traits cache,
+        so _get_traits doesn't need a second round trip.
 
         ITERATION NOTE: Add cache invalidation on persona updates
         """
@@ -311,18 +631,24 @@ class ContextManager:
 
         query = """
         MATCH (p:Persona)
-        RETURN p, elementId(p) as id
-        LIMIT 1
+        WITH p LIMIT 1
+        OPTIONAL MATCH (p)-[:HAS_TRAIT]->(t:Trait)
+        WITH p, t ORDER BY t.strength DESC
+        RETURN p, elementId(p) as id, collect(t)[..10] as traits
         """
 
-        with self.graph.session() as session:
-            result = session.run(query)
-            record = result.single()
+        async with self.graph.async_session() as session:
+            result = await session.run(query)
+            record = await result.single()
             if record and record["p"]:
                 data = dict(record["p"])
                 data["id"] = record["id"]
                 self._persona_id = record["id"]
                 self._core_identity_cache = data
+                self._cache["traits"] = (
+                    time.monotonic(),
+                    [dict(t) for t in record["traits"]]
+                )
                 return data
 
         return {}
@@ -331,8 +657,10 @@ class ContextManager:
         """
         Get persona traits.
 
+        Cached for _TTLS["traits"] seconds.
+
         ITERATION NOTE:
-        - Currently loads all traits
+        - Currently loads the top 10 traits by strength
         - Future: prioritize by strength, filter by context
         """
         if not self._persona_id:
@@ -341,6 +669,10 @@ class ContextManager:
         if not self._persona_id:
             return []
 
+        return await self._cached("traits", self._fetch_traits)
+
+    async def _fetch_traits(self) -> List[Dict[str, Any]]:
+        """Load the persona's strongest traits from Neo4j."""
         query = """
         MATCH (p:Persona)-[:HAS_TRAIT]->(t:Trait)
         WHERE elementId(p) = $persona_id
@@ -350,17 +682,39 @@ class ContextManager:
         """
 
         traits = []
-        with self.graph.session() as session:
-            result = session.run(query, persona_id=self._persona_id)
-            for record in result:
+        async with self.graph.async_session() as session:
+            result = await session.run(query, persona_id=self._persona_id)
+            async for record in result:
                 traits.append(dict(record["t"]))
 
         return traits
 
+    async def _embed_query(self, query: str) -> Optional[List[float]]:
+        """
+        Embed a query, using the in-process embedding cache.
+
+        Returns None if the embedder fails.
+        """
+        try:
+            model = self.embedder.model_name
+            query_embedding = self._emb_cache.get(query, model)
+            if query_embedding is None:
+                query_embedding = await self.embedder.embed(query)
+                self._emb_cache.set(query, model, query_embedding)
+            return query_embedding
+        except Exception as e:
+            # ITERATION NOTE: Better error handling needed
+            logger.warning("Embedding failed", exc_info=e)
+            return None
+
     async def _get_relevant_memories(
         self,
         query: str,
-        limit: int = 5
+        limit: int = 5,
+        query_embedding: Optional[List[float]] = None,
+        retrieval_mode: RetrievalMode = "hybrid",
+        half_life_days: float = 7.0,
+        alpha: float = 0.7
     ) -> tuple[List[Dict[str, Any]], int]:
         """
         Retrieve memories relevant to the query using embedding similarity.
@@ -368,16 +722,19 @@ class ContextManager:
         Args:
             query: User message to match against
             limit: Max memories to return
+            query_embedding: Precomputed embedding of query (embedded here if None)
+            retrieval_mode: "vector", "bm25" or "hybrid" (vector + BM25 via RRF).
+                The Python fallback (no vector index) is always cosine-only.
+            half_life_days: Recency half-life for temporal decay
+            alpha: Similarity weight (1 - alpha goes to recency)
 
         Returns:
             Tuple of (memories, total_considered)
 
         ITERATION NOTE: This is the MOST IMPORTANT function to iterate on.
-        Current implementation is basic cosine similarity.
+        Current implementation is hybrid cosine + BM25 (RRF).
 
         Future improvements:
-        - Hybrid search (combine embedding + keyword)
-        - Temporal weighting (recent memories score higher)
         - Usage tracking (frequently helpful memories score higher)
         - Entity extraction (if query mentions "mom", find family memories)
         - Contextual boosting (work context boosts work memories)
@@ -390,78 +747,195 @@ class ContextManager:
         if not self._persona_id:
             return [], 0
 
-        # Get query embedding
-        try:
-            query_embedding = await self.embedder.embed(query)
-        except Exception as e:
-            # ITERATION NOTE: Better error handling needed
-            print(f"Embedding failed: {e}")
+        # Get query embedding (repeated queries hit the in-process cache)
+        if query_embedding is None:
+            query_embedding = await self._embed_query(query)
+        if query_embedding is None:
             return await self._get_recent_memories(limit), 0
 
-        # Check if we have vector index
-        # ITERATION NOTE: Should cache whether index exists
-        try:
-            # Try vector search first
-            memories, total = await self._vector_search_memories(
-                query_embedding,
-                limit
-            )
-            if memories:
-                return memories, total
-        except Exception as e:
-            # Vector index might not exist, fall back to loading all and computing
-            print(f"Vector search failed, using fallback: {e}")
+        # Check if we have vector index (result cached on the instance)
+        if await self._ensure_memory_indexes(len(query_embedding)):
+            try:
+                # Try index search first
+                memories, total = await self._vector_search_memories(
+                    query_embedding,
+                    limit,
+                    query_text=query,
+                    retrieval_mode=retrieval_mode,
+                    half_life_days=half_life_days,
+                    alpha=alpha
+                )
+                if memories:
+                    return memories, total
+            except Exception as e:
+                # Only a missing index is remembered (later calls go straight
+                # to the fallback); transient errors, expired sessions or a
+                # bad full-text query fall back for this call only
+                logger.warning("Vector search failed, using fallback", exc_info=e)
+                if _is_missing_index_error(e):
+                    self._vector_index_available = False
 
         # Fallback: Load memories and compute similarity in Python
         # ITERATION NOTE: This is inefficient, but works without vector index
         return await self._fallback_memory_search(query_embedding, limit)
 
+    async def _ensure_memory_indexes(self, dimensions: int) -> bool:
+        """
+        Create the Memory vector and full-text indexes if they don't exist.
+
+        Only attempted once per instance; the outcome is cached so the
+        retrieval path doesn't pay for the check on every call.
+        """
+        if self._vector_index_available is not None:
+            return self._vector_index_available
+
+        vector_index = f"""
+        CREATE VECTOR INDEX {MEMORY_VECTOR_INDEX} IF NOT EXISTS
+        FOR (m:Memory)
+        ON m.embedding
+        OPTIONS {{
+            indexConfig: {{
+                `vector.dimensions`: {int(dimensions)},
+                `vector.similarity_function`: 'cosine'
+            }}
+        }}
+        """
+        text_index = f"""
+        CREATE FULLTEXT INDEX {MEMORY_TEXT_INDEX} IF NOT EXISTS
+        FOR (m:Memory) ON EACH [m.content, m.name]
+        """
+        try:
+            async with self.graph.async_session() as session:
+                for index_query in (vector_index, text_index):
+                    result = await session.run(index_query)
+                    await result.consume()
+            self._vector_index_available = True
+        except Exception as e:
+            # Neo4j < 5.11 has no vector indexes (a client error, cached);
+            # anything else may be transient, so the check is retried
+            logger.warning("Memory vector index unavailable, using fallback", exc_info=e)
+            if not (getattr(e, "code", None) or "").startswith("Neo.ClientError"):
+                return False
+            self._vector_index_available = False
+
+        return self._vector_index_available
+
     async def _vector_search_memories(
         self,
         embedding: List[float],
-        limit: int
+        limit: int,
+        query_text: Optional[str] = None,
+        retrieval_mode: RetrievalMode = "hybrid",
+        half_life_days: float = 7.0,
+        alpha: float = 0.7
     ) -> tuple[List[Dict[str, Any]], int]:
         """
-        Search memories using Neo4j vector index.
+        Search memories using Neo4j vector and full-text indexes.
 
-        Requires vector index on Memory.embedding
+        Requires the Memory indexes (see _ensure_memory_indexes). The HNSW
+        index returns approximate top-k neighbours instead of scanning every
+        memory.
+
+        Args:
+            embedding: Query embedding
+            limit: Max memories to return
+            query_text: Raw query, used for BM25 matching
+            retrieval_mode: "vector" (cosine only), "bm25" (full-text only)
+                or "hybrid" (both, fused with Reciprocal Rank Fusion)
+            half_life_days: Age at which a memory's recency weight halves
+            alpha: Weight of similarity vs recency in the final score
+
+        _relevance_score is alpha * similarity + (1 - alpha) * recency,
+        where similarity is cosine ("vector") or normalized RRF
+        ("bm25"/"hybrid"). Memories with evergreen=true are never decayed.
 
         ITERATION NOTE:
         - Need to ensure memories have embeddings when created
-        - Consider hybrid search combining vector + text
+        - The indexes span all personas, so we over-fetch candidates
+          before filtering to this persona's memories
         """
-        query = """
-        MATCH (p:Persona)-[:HAS_MEMORY]->(m:Memory)
-        WHERE elementId(p) = $persona_id AND m.embedding IS NOT NULL
-        WITH m, gds.similarity.cosine(m.embedding, $embedding) AS score
-        WHERE score > 0.5
-        RETURN m, score
-        ORDER BY score DESC
-        LIMIT $limit
+        text = _escape_lucene(query_text or "").strip()
+        if not text:
+            retrieval_mode = "vector"
+
+        if retrieval_mode == "vector":
+            query = f"""
+            CALL db.index.vector.queryNodes('{MEMORY_VECTOR_INDEX}', $candidates, $embedding)
+            YIELD node AS m, score
+            MATCH (p:Persona)-[:HAS_MEMORY]->(m)
+            WHERE elementId(p) = $persona_id AND score > 0.5
+            """
+        else:
+            # Each branch ranks its own hits; RRF sums 1/(k + rank) across branches
+            vector_branch = f"""
+                CALL db.index.vector.queryNodes('{MEMORY_VECTOR_INDEX}', $candidates, $embedding)
+                YIELD node, score
+                WHERE score > 0.5
+                WITH collect(node) AS nodes
+                UNWIND range(0, size(nodes) - 1) AS rank
+                RETURN nodes[rank] AS m, rank
+            """
+            text_branch = f"""
+                CALL db.index.fulltext.queryNodes('{MEMORY_TEXT_INDEX}', $text, {{limit: $candidates}})
+                YIELD node, score
+                WITH collect(node) AS nodes
+                UNWIND range(0, size(nodes) - 1) AS rank
+                RETURN nodes[rank] AS m, rank
+            """
+            branches = [text_branch]
+            if retrieval_mode == "hybrid":
+                branches.insert(0, vector_branch)
+
+            # RRF is normalized by its maximum so it blends with recency on a 0-1 scale
+            query = f"""
+            CALL {{
+                {"UNION ALL".join(branches)}
+            }}
+            MATCH (p:Persona)-[:HAS_MEMORY]->(m)
+            WHERE elementId(p) = $persona_id
+            WITH m, sum(1.0 / ($rrf_k + rank + 1)) * ($rrf_k + 1) / {len(branches)} AS score
+            """
+
+        # Temporal decay, fused into the ranking: evergreen memories never decay
+        query += """
+            WITH m, score,
+                 CASE WHEN m.created_at IS NULL OR coalesce(m.evergreen, false) THEN 1.0
+                      ELSE exp(-$decay_rate * duration.inSeconds(datetime(m.created_at), datetime()).seconds)
+                 END AS recency
+            WITH m, $alpha * score + (1 - $alpha) * recency AS score
+            ORDER BY score DESC
+            LIMIT $limit
+            WITH collect({m: m, score: score}) AS hits
+            CALL {
+                MATCH (p:Persona)-[:HAS_MEMORY]->(m2:Memory)
+                WHERE elementId(p) = $persona_id
+                RETURN count(m2) AS total
+            }
+            RETURN hits, total
         """
 
+        # Hits and the persona's memory count come back in one round trip
         memories = []
-        with self.graph.session() as session:
-            result = session.run(
+        total = 0
+        async with self.graph.async_session() as session:
+            result = await session.run(
                 query,
                 persona_id=self._persona_id,
                 embedding=embedding,
+                text=text,
+                rrf_k=RRF_K,
+                alpha=alpha,
+                decay_rate=math.log(2) / (half_life_days * 86400),
+                candidates=limit * 4,
                 limit=limit
             )
-            for record in result:
-                mem = dict(record["m"])
-                mem["_relevance_score"] = record["score"]
-                memories.append(mem)
-
-        # Get total count
-        count_query = """
-        MATCH (p:Persona)-[:HAS_MEMORY]->(m:Memory)
-        WHERE elementId(p) = $persona_id
-        RETURN count(m) as total
-        """
-        with self.graph.session() as session:
-            result = session.run(count_query, persona_id=self._persona_id)
-            total = result.single()["total"]
+            record = await result.single()
+            if record:
+                total = record["total"]
+                for hit in record["hits"]:
+                    mem = dict(hit["m"])
+                    mem["_relevance_score"] = hit["score"]
+                    memories.append(mem)
 
         return memories, total
 
@@ -478,20 +952,29 @@ class ContextManager:
         ITERATION NOTE:
         - This is O(n) and won't scale
         - Need to create vector index or use external vector DB
-        - Consider caching memory embeddings
+        - Missing embeddings are computed in one batch and written back
+          in the background
         """
         import numpy as np
 
+        # Memories that already have an int8 copy skip the float vector on
+        # the wire (embedding_norm/embedding_bytes are legacy copies from
+        # older write-backs; never read, so never shipped)
         query = """
         MATCH (p:Persona)-[:HAS_MEMORY]->(m:Memory)
         WHERE elementId(p) = $persona_id
-        RETURN m, elementId(m) as id
+        RETURN m {
+            .*,
+            embedding: CASE WHEN m.embedding_q8 IS NULL THEN m.embedding END,
+            embedding_norm: null,
+            embedding_bytes: null
+        } AS m, elementId(m) as id
         """
 
         memories = []
-        with self.graph.session() as session:
-            result = session.run(query, persona_id=self._persona_id)
-            for record in result:
+        async with self.graph.async_session() as session:
+            result = await session.run(query, persona_id=self._persona_id)
+            async for record in result:
                 mem = dict(record["m"])
                 mem["id"] = record["id"]
                 memories.append(mem)
@@ -501,63 +984,117 @@ class ContextManager:
         if not memories:
             return [], 0
 
-        # Compute embeddings for memories that don't have them
-        # ITERATION NOTE: Should pre-compute and store these
-        memories_with_scores = []
-        query_vec = np.array(query_embedding)
-
-        for mem in memories:
-            if mem.get("embedding"):
-                mem_vec = np.array(mem["embedding"])
-                # Cosine similarity
-                score = np.dot(query_vec, mem_vec) / (
-                    np.linalg.norm(query_vec) * np.linalg.norm(mem_vec)
-                )
-                mem["_relevance_score"] = float(score)
-                memories_with_scores.append(mem)
-            else:
-                # No embedding, compute one
-                # ITERATION NOTE: Should batch these and store
-                try:
-                    content = mem.get("content", mem.get("name", ""))
-                    mem_embedding = await self.embedder.embed(content)
-                    mem_vec = np.array(mem_embedding)
-                    score = np.dot(query_vec, mem_vec) / (
-                        np.linalg.norm(query_vec) * np.linalg.norm(mem_vec)
+        # Batch-embed memories that don't have embeddings yet
+        with_emb = [m for m in memories if m.get("embedding_q8") or m.get("embedding")]
+        to_embed = [m for m in memories if not (m.get("embedding_q8") or m.get("embedding"))]
+        unscored = []
+        if to_embed:
+            texts = [m.get("content") or m.get("name") or "" for m in to_embed]
+            try:
+                new_embeddings = []
+                for i in range(0, len(texts), EMBED_BATCH_SIZE):
+                    new_embeddings.extend(
+                        await self.embedder.embed_batch(texts[i:i + EMBED_BATCH_SIZE])
                     )
-                    mem["_relevance_score"] = float(score)
-                    memories_with_scores.append(mem)
-
-                    # Store embedding for future use
-                    # ITERATION NOTE: Do this async in background
-                    await self._store_memory_embedding(mem["id"], mem_embedding)
-                except Exception as e:
-                    print(f"Failed to embed memory: {e}")
+                for mem, embedding in zip(to_embed, new_embeddings):
+                    mem["embedding"] = embedding
+                with_emb.extend(to_embed)
+            except Exception as e:
+                logger.warning("Failed to embed memories", exc_info=e)
+                for mem in to_embed:
                     mem["_relevance_score"] = 0.0
-                    memories_with_scores.append(mem)
-
-        # Sort by score and take top-k
-        memories_with_scores.sort(key=lambda x: x.get("_relevance_score", 0), reverse=True)
-
-        return memories_with_scores[:limit], total
-
-    async def _store_memory_embedding(self, memory_id: str, embedding: List[float]):
+                unscored = to_embed
+
+        if not with_emb:
+            return unscored[:limit], total
+
+        query_vec = np.asarray(query_embedding, dtype=np.float32)
+        query_vec /= np.linalg.norm(query_vec) + 1e-12
+        scores = np.empty(len(with_emb), dtype=np.float32)
+
+        # Quantized rows: int8 dot product rescaled by the per-vector scale.
+        # Accumulates in float32 - int16 would overflow at d=1536.
+        q8_idx = [i for i, m in enumerate(with_emb) if m.get("embedding_q8")]
+        if q8_idx:
+            m8 = np.vstack([_as_vector(with_emb[i]["embedding_q8"], np.int8) for i in q8_idx])
+            scales = np.asarray(
+                [with_emb[i].get("embedding_scale") or 0.0 for i in q8_idx],
+                dtype=np.float32
+            )
+            scores[q8_idx] = (m8.astype(np.float32) @ query_vec) * scales
+
+        # Float rows (no int8 copy yet): normalize, then score
+        float_idx = [i for i, m in enumerate(with_emb) if not m.get("embedding_q8")]
+        if float_idx:
+            rows = [with_emb[i] for i in float_idx]
+            mat = np.vstack([_as_vector(m["embedding"], np.float32) for m in rows])
+            mat /= np.linalg.norm(mat, axis=1, keepdims=True) + 1e-12
+            scores[float_idx] = mat @ query_vec
+
+            # Persist the int8 copy (of the unit vector) in the background
+            # so the next search takes the quantized path and retrieval
+            # doesn't wait on the write. The raw vector is only sent for
+            # memories embedded just now; stored ones keep theirs (coalesce)
+            fresh = {id(mem) for mem in to_embed}
+            store_rows = []
+            for i, mem in enumerate(rows):
+                q8, scale = _quantize_int8(mat[i])
+                store_rows.append({
+                    "id": mem["id"],
+                    "embedding": mem["embedding"] if id(mem) in fresh else None,
+                    "embedding_q8": q8,
+                    "embedding_scale": scale,
+                })
+            self._run_in_background(self._store_memory_embeddings(store_rows))
+
+        for mem, score in zip(with_emb, scores):
+            mem["_relevance_score"] = float(score)
+
+        # Top-k selection without sorting every score
+        k = min(limit, len(with_emb))
+        if k < len(with_emb):
+            top = np.argpartition(-scores, k - 1)[:k]
+        else:
+            top = np.arange(len(with_emb))
+        top = top[np.argsort(-scores[top])]
+
+        ranked = [with_emb[i] for i in top]
+        return (ranked + unscored)[:limit], total
+
+    async def _store_memory_embeddings(self, rows: List[Dict[str, Any]]):
         """
-        Store computed embedding back to memory node.
+        Store computed embeddings back to memory nodes in one round trip.
 
-        ITERATION NOTE:
-        - Should do this in background
-        - Should batch multiple updates
+        Besides the raw vector (which the vector index reads), only one
+        search copy is kept: the int8 quantized unit vector
+        (embedding_q8 * embedding_scale), stored as a byte array so it's
+        read with np.frombuffer. Scoring it is a plain dot product. Older
+        normalized float copies are dropped as rows are rewritten.
+
+        Args:
+            rows: [{"id": memory element id, "embedding": [...],
+                    "embedding_q8": bytes, "embedding_scale": float}, ...]
         """
         query = """
-        MATCH (m:Memory) WHERE elementId(m) = $id
-        SET m.embedding = $embedding
+        UNWIND $rows AS row
+        MATCH (m:Memory) WHERE elementId(m) = row.id
+        SET m.embedding = coalesce(row.embedding, m.embedding),
+            m.embedding_q8 = row.embedding_q8,
+            m.embedding_scale = row.embedding_scale
+        REMOVE m.embedding_norm, m.embedding_bytes
         """
         try:
-            with self.graph.session() as session:
-                session.run(query, id=memory_id, embedding=embedding)
+            async with self.graph.async_session() as session:
+                result = await session.run(query, rows=rows)
+                await result.consume()
         except Exception as e:
-            print(f"Failed to store embedding: {e}")
+            logger.warning("Failed to store embeddings", exc_info=e)
+
+    def _run_in_background(self, coro):
+        """Schedule a fire-and-forget coroutine, keeping a reference until it finishes."""
+        task = asyncio.create_task(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
 
     async def _get_recent_memories(self, limit: int = 5) -> List[Dict[str, Any]]:
         """
@@ -577,9 +1114,9 @@ class ContextManager:
         """
 
         memories = []
-        with self.graph.session() as session:
-            result = session.run(query, persona_id=self._persona_id, limit=limit)
-            for record in result:
+        async with self.graph.async_session() as session:
+            result = await session.run(query, persona_id=self._persona_id, limit=limit)
+            async for record in result:
                 memories.append(dict(record["m"]))
 
         return memories
@@ -591,6 +1128,8 @@ class ContextManager:
         """
         Get preferences by category.
 
+        Cached for _TTLS["preferences"] seconds per (persona, category set).
+
         ITERATION NOTE:
         - Add confidence threshold filtering
         - Add preference staleness detection
@@ -599,6 +1138,15 @@ class ContextManager:
         if not self._persona_id:
             return []
 
+        key = ("preferences", self._persona_id, frozenset(categories))
+        return await self._cached(
+            key,
+            lambda: self._fetch_preferences(categories),
+            ttl=self._TTLS["preferences"]
+        )
+
+    async def _fetch_preferences(self, categories: List[str]) -> List[Dict[str, Any]]:
+        """Load the persona's most confident preferences in categories from Neo4j."""
         query = """
         MATCH (p:Persona)-[:LEARNED_PREFERENCE]->(pref:Preference)
         WHERE elementId(p) = $persona_id
@@ -609,13 +1157,13 @@ class ContextManager:
         """
 
         preferences = []
-        with self.graph.session() as session:
-            result = session.run(
+        async with self.graph.async_session() as session:
+            result = await session.run(
                 query,
                 persona_id=self._persona_id,
                 categories=categories
             )
-            for record in result:
+            async for record in result:
                 preferences.append(dict(record["pref"]))
 
         return preferences
@@ -624,19 +1172,24 @@ class ContextManager:
         """
         Get user information for context.
 
+        Cached for _TTLS["user"] seconds.
+
         ITERATION NOTE:
-        - Cache user info
         - Add user preference summary
         """
+        return await self._cached("user", self._fetch_user_context)
+
+    async def _fetch_user_context(self) -> Optional[Dict[str, Any]]:
+        """Load the primary User node from Neo4j."""
         query = """
         MATCH (u:User)
         RETURN u, elementId(u) as id
         LIMIT 1
         """
 
-        with self.graph.session() as session:
-            result = session.run(query)
-            record = result.single()
+        async with self.graph.async_session() as session:
+            result = await session.run(query)
+            record = await result.single()
             if record and record["u"]:
                 data = dict(record["u"])
                 data["id"] = record["id"]
@@ -644,6 +1197,26 @@ class ContextManager:
 
         return None
 
+    async def _cached(self, key, fetcher, ttl: Optional[float] = None):
+        """
+        Return a cached value for key, calling fetcher() when missing or stale.
+
+        Args:
+            key: Cache key (also the _TTLS entry used when ttl is None);
+                any hashable, e.g. a tuple for parameterized lookups
+            fetcher: Async callable producing the value
+            ttl: Seconds the value stays fresh
+        """
+        ttl = self._TTLS[key] if ttl is None else ttl
+        entry = self._cache.get(key)
+        now = time.monotonic()
+        if entry is not None and now - entry[0] < ttl:
+            return entry[1]
+
+        value = await fetcher()
+        self._cache[key] = (now, value)
+        return value
+
     def invalidate_cache(self):
         """
         Clear cached context.
@@ -652,6 +1225,22 @@ class ContextManager:
         """
         self._core_identity_cache = None
         self._persona_id = None
+        self._vector_index_available = None
+        self._context_cache.clear()
+        self._cache.clear()
+
+    def invalidate_persona_cache(self):
+        """
+        Drop cached persona data (identity, traits, preferences) and whole
+        cached contexts.
+
+        Call this after persona updates. Unlike invalidate_cache it keeps
+        the persona id and the vector index check, which the update
+        doesn't change.
+        """
+        self._core_identity_cache = None
+        self._context_cache.clear()
+        self._cache.clear()
 
 
 # Singleton instance
@@ -10,14 +10,154 @@ These handlers implement the core tools that are always available:
 """
 
 import os
-import json
-from datetime import datetime
-from typing import Dict, Any, List, Optional
+import time
+import importlib
+import itertools
+import logging
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Callable, NamedTuple, Tuple
+
+logger = logging.getLogger(__name__)
 
 # Lazy imports to avoid circular dependencies
 _graph = None
 _registry = None
 
+# Names resolved on first use ("module" or "module:attribute"), so e.g.
+# list_available_tools never pays for json or the cognitive models
+_LAZY = {
+    "json": "json",
+    "datetime": "datetime:datetime",
+    "timezone": "datetime:timezone",
+    "NodeType": "..cognitive.models:NodeType",
+    "ProjectCategory": "..cognitive.models:ProjectCategory",
+    "RelationType": "..cognitive.models:RelationType",
+    "InsightNode": "..cognitive.models:InsightNode",
+    "_escape_lucene": ".context_manager:_escape_lucene",
+}
+
+
+def __getattr__(name: str):
+    """PEP 562: import _LAZY names on first attribute access and cache them."""
+    try:
+        spec = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module, _, attr = spec.partition(":")
+    obj = importlib.import_module(module, __package__)
+    if attr:
+        obj = getattr(obj, attr)
+    globals()[name] = obj
+    return obj
+
+
+def _lazy(name: str):
+    """Resolve a _LAZY name from inside this module (globals bypass __getattr__)."""
+    obj = globals().get(name)
+    return obj if obj is not None else __getattr__(name)
+
+
+# Enum name -> {value: member}, built on first use
+_ENUM_MAPS: Dict[str, Dict[str, Any]] = {}
+
+
+def _enum_map(name: str) -> Dict[str, Any]:
+    """Value -> member lookup for a _LAZY enum, so coercion is a dict hit."""
+    members = _ENUM_MAPS.get(name)
+    if members is None:
+        members = _ENUM_MAPS[name] = {m.value: m for m in _lazy(name)}
+    return members
+
+# Read-through cache for graph sub-queries. Entries expire after the TTL;
+# writes made through update_cognitive_tree drop affected entries at once
+SUBQUERY_CACHE_SIZE = 512
+SUBQUERY_CACHE_TTL = 30
+
+# Template key -> node labels the query reads ("*" = any label)
+_TEMPLATE_LABELS = {
+    "cognitive_context": {
+        "User", "Project", "Person", "Insight", "Task", "Cycle", "Memory",
+        "Persona", "Trait",
+    },
+    "search": {"*"},
+    "search_scan": {"*"},
+}
+
+
+def _freeze(value):
+    """Make query params hashable for use in a cache key."""
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple, set)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+class _SubqueryCache:
+    """
+    LRU + TTL cache of graph query results keyed by (template_key, params).
+
+    Each template is tagged with the node labels it reads (see
+    _TEMPLATE_LABELS) so a write to one node type only invalidates the
+    queries that could see it. Invalidations bump a generation counter;
+    a load that overlapped one isn't stored, so a result read before a
+    write can't be put back after it.
+    """
+
+    def __init__(self, maxsize: int = SUBQUERY_CACHE_SIZE, ttl: float = SUBQUERY_CACHE_TTL):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[tuple, tuple]" = OrderedDict()
+        self._lock = threading.RLock()
+        self._generation = 0
+
+    def get_or_load(self, template_key: str, params: Dict[str, Any], loader: Callable[[], Any]):
+        """Return the cached result, calling loader() when missing or stale."""
+        key = (template_key, _freeze(params))
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and now - entry[0] < self.ttl:
+                self._entries.move_to_end(key)
+                return entry[1]
+            generation = self._generation
+
+        value = loader()
+        with self._lock:
+            if generation != self._generation:
+                return value
+            self._entries[key] = (now, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return value
+
+    def invalidate_by_node_type(self, node_type: str):
+        """Drop entries whose template reads node_type."""
+        with self._lock:
+            self._generation += 1
+            for key in list(self._entries):
+                labels = _TEMPLATE_LABELS.get(key[0], {"*"})
+                if node_type in labels or "*" in labels:
+                    del self._entries[key]
+
+    def clear(self):
+        """Drop all entries."""
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+
+
+_subquery_cache = _SubqueryCache()
+
+
+def _cached_query(template_key: str, cypher: str, params: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Run a raw Cypher query through the sub-query cache."""
+    return _subquery_cache.get_or_load(
+        template_key, params, lambda: _get_graph().raw_query(cypher, params)
+    )
+
 
 def _get_graph():
     global _graph
@@ -35,6 +175,228 @@ def _get_registry():
     return _registry
 
 
+# One write session per thread, reused across creates; the driver's pool
+# hands it a connection per transaction
+_write_local = threading.local()
+
+
+def _get_write_session():
+    """Return this thread's reusable write session, opening it on first use."""
+    session = getattr(_write_local, "session", None)
+    if session is None or session.closed():
+        from neo4j import WRITE_ACCESS
+        session = _get_graph().driver.session(default_access_mode=WRITE_ACCESS)
+        _write_local.session = session
+    return session
+
+
+def _run_write(query: str, **params):
+    """Run a write query in its own transaction on the reusable session."""
+    session = _get_write_session()
+    with session.begin_transaction() as tx:
+        record = tx.run(query, **params).single()
+        tx.commit()
+    return record
+
+
+def _person_props(data: Dict[str, Any], now: str) -> Dict[str, Any]:
+    return {
+        "name": data.get("name"),
+        "email": data.get("email"),
+        "phone": data.get("phone"),
+        "relationship": data.get("relationship"),
+        "notes": data.get("notes") or data.get("context"),
+        "created_at": now,
+    }
+
+
+def _task_props(data: Dict[str, Any], now: str) -> Dict[str, Any]:
+    description = str(data.get("description") or "")
+    return {
+        "name": description[:100],
+        "description": description,
+        "status": data.get("status", "pending"),
+        "priority": data.get("priority", 5),
+        "created_at": now,
+    }
+
+
+# Node types created directly from properties (no graph helper)
+_NODE_PROPS = {
+    "Person": _person_props,
+    "Task": _task_props,
+}
+
+# One parameterized statement for every label, so Neo4j keeps a single
+# cached plan instead of one per node type
+_APOC_CREATE_CYPHER = """
+CALL apoc.create.node($labels, $props) YIELD node
+RETURN node, elementId(node) as id
+"""
+
+_APOC_BULK_CREATE_CYPHER = """
+UNWIND $items AS props
+CALL apoc.create.node($labels, props) YIELD node
+RETURN elementId(node) as id
+"""
+
+# Per-label fallbacks for servers without APOC
+_CREATE_CYPHER = {
+    label: f"CREATE (n:{label}) SET n = $props RETURN n, elementId(n) as id"
+    for label in _NODE_PROPS
+}
+
+_BULK_CREATE_CYPHER = {
+    label: f"UNWIND $items AS props CREATE (n:{label}) SET n = props RETURN elementId(n) as id"
+    for label in _NODE_PROPS
+}
+
+# None = not checked yet, True/False = apoc.create.node callable
+_apoc_available: Optional[bool] = None
+
+
+def _is_missing_procedure(error: Exception) -> bool:
+    return getattr(error, "code", None) == "Neo.ClientError.Procedure.ProcedureNotFound"
+
+
+def _create_node(label: str, props: Dict[str, Any]):
+    """Create a node with apoc.create.node, falling back to a plain CREATE."""
+    global _apoc_available
+    if _apoc_available is not False:
+        try:
+            record = _run_write(_APOC_CREATE_CYPHER, labels=[label], props=props)
+            _apoc_available = True
+            return record
+        except Exception as e:
+            if not _is_missing_procedure(e):
+                raise
+            _apoc_available = False
+    return _run_write(_CREATE_CYPHER[label], props=props)
+
+
+def _create_nodes(label: str, items: List[Dict[str, Any]]) -> List[str]:
+    """Create many nodes of one label in a single transaction; returns ids in order."""
+    global _apoc_available
+    session = _get_write_session()
+    if _apoc_available is not False:
+        try:
+            with session.begin_transaction() as tx:
+                ids = [r["id"] for r in tx.run(_APOC_BULK_CREATE_CYPHER, labels=[label], items=items)]
+                tx.commit()
+            _apoc_available = True
+            return ids
+        except Exception as e:
+            if not _is_missing_procedure(e):
+                raise
+            _apoc_available = False
+    with session.begin_transaction() as tx:
+        ids = [r["id"] for r in tx.run(_BULK_CREATE_CYPHER[label], items=items)]
+        tx.commit()
+    return ids
+
+
+# Sections fetched per get_cognitive_context context_type (unknown types
+# fetch nothing)
+_CONTEXT_SECTIONS = {
+    "full": ("user", "projects", "people", "recent", "persona"),
+    "user": ("user",),
+    "projects": ("projects",),
+    "people": ("people",),
+    "recent": ("recent",),
+}
+
+# Sections only reported when the node exists
+_OPTIONAL_SECTIONS = frozenset({"user", "persona"})
+
+# Section -> key in the get_cognitive_context result
+_CONTEXT_RESULT_KEYS = {
+    "user": "user",
+    "projects": "projects",
+    "people": "people",
+    "recent": "recent_activity",
+    "persona": "persona",
+}
+
+# Labels reported as recent activity; each has a created_at index so the
+# top $limit per label comes straight from the index
+_RECENT_LABELS = ["Insight", "Task", "Cycle", "Memory"]
+
+_RECENT_UNION = "\n    UNION ALL\n".join(
+    f"""    MATCH (n:{label})
+    WHERE 'recent' IN $wanted AND n.created_at IS NOT NULL
+    RETURN n ORDER BY n.created_at DESC LIMIT $limit"""
+    for label in _RECENT_LABELS
+)
+
+# All get_cognitive_context sections in one round trip. Unwanted sections
+# are short-circuited server-side by the $wanted predicates
+_COGNITIVE_CONTEXT_CYPHER = """
+CALL {
+""" + _RECENT_UNION + """
+}
+WITH n ORDER BY n.created_at DESC LIMIT $limit
+WITH collect({n: n {.*}, labels: labels(n), id: elementId(n)}) AS recent
+RETURN {
+    user: head(COLLECT {
+        MATCH (u:User)
+        WHERE 'user' IN $wanted
+        RETURN u {id: elementId(u), .name, .email, .first_name, .last_name}
+        LIMIT 1
+    }),
+    projects: COLLECT {
+        MATCH (p:Project)
+        WHERE 'projects' IN $wanted
+          AND CASE WHEN $project_name = ''
+                   THEN EXISTS { (:User)-[:OWNS]->(p) }
+                   ELSE toLower(p.name) CONTAINS toLower($project_name)
+              END
+        RETURN p {.*, id: elementId(p)}
+        ORDER BY p.created_at DESC
+        LIMIT $limit
+    },
+    people: COLLECT {
+        MATCH (n:Person)
+        WHERE 'people' IN $wanted
+        RETURN n {.*, id: elementId(n)}
+        ORDER BY n.created_at DESC
+        LIMIT $limit
+    },
+    recent: recent,
+    persona: head(COLLECT {
+        MATCH (p:Persona)
+        WHERE 'persona' IN $wanted
+        RETURN {
+            p: p {.*},
+            id: elementId(p),
+            traits: [(p)-[:HAS_TRAIT]->(t:Trait) | t.name]
+        }
+        LIMIT 1
+    })
+} AS ctx
+"""
+
+
+# Set once the created_at indexes behind the recent section exist
+_recent_indexes_checked = False
+
+
+def _ensure_recent_indexes():
+    """Create the per-label created_at indexes once per process."""
+    global _recent_indexes_checked
+    if _recent_indexes_checked:
+        return
+    graph = _get_graph()
+    for label in _RECENT_LABELS:
+        try:
+            graph.raw_query(
+                f"CREATE INDEX {label.lower()}_created IF NOT EXISTS "
+                f"FOR (n:{label}) ON (n.created_at)"
+            )
+        except Exception as e:
+            logger.warning("Failed to create created_at index for %s", label, exc_info=e)
+    _recent_indexes_checked = True
+
+
 def get_cognitive_context(
     context_type: str = "full",
     project_name: Optional[str] = None,
@@ -51,64 +413,30 @@ def get_cognitive_context(
     Returns:
         Dictionary with requested context
     """
-    graph = _get_graph()
     result = {}
 
-    try:
-        if context_type in ["full", "user"]:
-            user = graph.get_user()
-            if user:
-                result["user"] = {
-                    "id": user.get("id"),
-                    "name": user.get("name"),
-                    "email": user.get("email"),
-                    "first_name": user.get("first_name"),
-                    "last_name": user.get("last_name")
-                }
+    wanted = _CONTEXT_SECTIONS.get(context_type)
+    if not wanted:
+        return result
 
-        if context_type in ["full", "projects"]:
-            if project_name:
-                # Search for specific project
-                projects = graph.raw_query(
-                    """MATCH (p:Project)
-                       WHERE toLower(p.name) CONTAINS toLower($name)
-                       RETURN p, elementId(p) as id
-                       LIMIT $limit""",
-                    {"name": project_name, "limit": limit}
-                )
-                result["projects"] = projects
-            else:
-                projects = graph.get_user_projects(limit=limit)
-                result["projects"] = projects
-
-        if context_type in ["full", "people"]:
-            from ..cognitive.models import NodeType
-            people = graph.find_nodes(NodeType.PERSON, limit=limit)
-            result["people"] = people
-
-        if context_type in ["full", "recent"]:
-            recent = graph.raw_query(
-                """MATCH (n)
-                   WHERE n.created_at IS NOT NULL
-                   AND labels(n)[0] IN ['Insight', 'Task', 'Cycle', 'Memory']
-                   RETURN n, labels(n) as labels, elementId(n) as id
-                   ORDER BY n.created_at DESC
-                   LIMIT $limit""",
-                {"limit": limit}
-            )
-            result["recent_activity"] = recent
-
-        # Get persona info
-        if context_type == "full":
-            persona = graph.raw_query(
-                """MATCH (p:Persona)
-                   OPTIONAL MATCH (p)-[:HAS_TRAIT]->(t:Trait)
-                   RETURN p, elementId(p) as id, collect(t.name) as traits
-                   LIMIT 1""",
-                {}
-            )
-            if persona:
-                result["persona"] = persona[0] if persona else None
+    try:
+        if "recent" in wanted:
+            _ensure_recent_indexes()
+
+        rows = _cached_query(
+            "cognitive_context",
+            _COGNITIVE_CONTEXT_CYPHER,
+            {"wanted": wanted, "project_name": project_name or "", "limit": limit}
+        )
+        ctx = rows[0]["ctx"] if rows else {}
+
+        for section in wanted:
+            value = ctx.get(section)
+            if value is None:
+                if section in _OPTIONAL_SECTIONS:
+                    continue
+                value = []
+            result[_CONTEXT_RESULT_KEYS[section]] = value
 
     except Exception as e:
         result["error"] = str(e)
@@ -134,180 +462,389 @@ def update_cognitive_tree(
     Returns:
         Result of the operation
     """
-    graph = _get_graph()
-    now = datetime.utcnow().isoformat()
+    result = _apply_cognitive_update(operation, node_type, data, link_to)
 
-    try:
+    # Write-through: drop cached reads that could see this change
+    if result.get("success"):
         if operation == "create":
-            if node_type == "Project":
-                from ..cognitive.models import ProjectCategory
-                category = data.get("category", "general")
-                if isinstance(category, str):
-                    try:
-                        category = ProjectCategory(category)
-                    except ValueError:
-                        category = ProjectCategory.GENERAL
-
-                project = graph.create_project(
-                    name=data.get("name", "Unnamed Project"),
-                    description=data.get("description", ""),
-                    category=category
-                )
-                return {
-                    "success": True,
-                    "operation": "create",
-                    "node_type": "Project",
-                    "id": project.get("id"),
-                    "name": project.get("name")
-                }
+            _subquery_cache.invalidate_by_node_type(node_type)
+        else:
+            # update/link can touch a node of any type
+            _subquery_cache.clear()
 
-            elif node_type == "Person":
-                query = """
-                CREATE (p:Person {
-                    name: $name,
-                    email: $email,
-                    phone: $phone,
-                    relationship: $relationship,
-                    notes: $notes,
-                    created_at: $now
-                })
-                RETURN p, elementId(p) as id
-                """
-                with graph.session() as session:
-                    result = session.run(
-                        query,
-                        name=data.get("name"),
-                        email=data.get("email"),
-                        phone=data.get("phone"),
-                        relationship=data.get("relationship"),
-                        notes=data.get("notes") or data.get("context"),
-                        now=now
-                    )
-                    record = result.single()
-                    if record:
-                        return {
-                            "success": True,
-                            "operation": "create",
-                            "node_type": "Person",
-                            "id": record["id"],
-                            "name": data.get("name")
-                        }
-
-            elif node_type == "Task":
-                cycle_id = data.get("cycle_id")
-                if cycle_id:
-                    task = graph.add_task_to_cycle(
-                        cycle_id=cycle_id,
-                        description=data.get("description", ""),
-                        priority=data.get("priority", 5)
-                    )
-                    return {
-                        "success": True,
-                        "operation": "create",
-                        "node_type": "Task",
-                        "id": task.get("id")
-                    }
-                else:
-                    # Create standalone task
-                    query = """
-                    CREATE (t:Task {
-                        name: $name,
-                        description: $description,
-                        status: $status,
-                        priority: $priority,
-                        created_at: $now
-                    })
-                    RETURN t, elementId(t) as id
-                    """
-                    with graph.session() as session:
-                        result = session.run(
-                            query,
-                            name=data.get("description", "")[:100],
-                            description=data.get("description", ""),
-                            status=data.get("status", "pending"),
-                            priority=data.get("priority", 5),
-                            now=now
-                        )
-                        record = result.single()
-                        if record:
-                            return {
-                                "success": True,
-                                "operation": "create",
-                                "node_type": "Task",
-                                "id": record["id"]
-                            }
-
-            elif node_type == "Insight":
-                from ..cognitive.models import InsightNode
-                insight = InsightNode.create(
-                    insight=data.get("insight", data.get("content", "")),
-                    source_type=data.get("source_type", "conversation"),
-                    confidence=data.get("confidence", 0.7)
-                )
-                insight_id = graph.create_node(insight)
-                return {
-                    "success": True,
-                    "operation": "create",
-                    "node_type": "Insight",
-                    "id": insight_id
-                }
+    return result
+
+
+# Relationships that get_persona_info reads; only links of these types
+# can change it
+_PERSONA_REL_TYPES = {"HAS_TRAIT", "HAS_MEMORY", "LEARNED_PREFERENCE"}
 
-            elif node_type == "Goal":
-                goal = graph.create_goal(
-                    name=data.get("name", ""),
-                    description=data.get("description", ""),
-                    timeframe=data.get("timeframe")
-                )
-                return {
+# L1 cache for get_persona_info, validated against the persona's version tag
+_persona_cache: Dict[str, Any] = {"version": None, "value": None}
+
+# Bumps the persona version when a new link starts at the persona
+_TOUCH_PERSONA_CYPHER = """
+MATCH (p:Persona)
+WHERE elementId(p) IN $ids
+SET p.updated_at = $now
+"""
+
+
+def _touch_persona(node_ids: List[str]):
+    """Bump Persona.updated_at and drop the persona L1 cache."""
+    try:
+        _run_write(
+            _TOUCH_PERSONA_CYPHER,
+            ids=node_ids,
+            now=_lazy("datetime").utcnow().isoformat()
+        )
+    except Exception as e:
+        logger.warning("Failed to bump persona version", exc_info=e)
+    _persona_cache["value"] = None
+
+
+def update_cognitive_tree_bulk(items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Apply several update_cognitive_tree operations in one go.
+
+    Person and standalone Task creates are grouped by node type and
+    written with one UNWIND query per group; everything else goes
+    through update_cognitive_tree.
+
+    Args:
+        items: [{"operation", "node_type", "data", "link_to"}, ...]
+
+    Returns:
+        One result per item, in input order
+    """
+    now = _lazy("datetime").utcnow().isoformat()
+    results: List[Optional[Dict[str, Any]]] = [None] * len(items)
+    groups: Dict[str, List[int]] = {}
+
+    for i, item in enumerate(items):
+        node_type = item.get("node_type")
+        data = item.get("data") or {}
+        if (item.get("operation") == "create" and node_type in _NODE_PROPS
+                and not (node_type == "Task" and data.get("cycle_id"))):
+            groups.setdefault(node_type, []).append(i)
+        else:
+            results[i] = update_cognitive_tree(
+                item.get("operation"), node_type, data, item.get("link_to")
+            )
+
+    for node_type, indexes in groups.items():
+        props = [_NODE_PROPS[node_type](items[i].get("data") or {}, now) for i in indexes]
+        try:
+            ids = _create_nodes(node_type, props)
+            _subquery_cache.invalidate_by_node_type(node_type)
+            for i, node_props, node_id in zip(indexes, props, ids):
+                results[i] = {
                     "success": True,
                     "operation": "create",
-                    "node_type": "Goal",
-                    "id": goal.get("id"),
-                    "name": goal.get("name")
+                    "node_type": node_type,
+                    "id": node_id,
+                    "name": node_props.get("name")
                 }
+        except Exception as e:
+            for i in indexes:
+                results[i] = {"success": False, "error": str(e)}
+
+    return results
+
+
+def _unknown_operation(operation: str) -> Dict[str, Any]:
+    return {"success": False, "error": f"Unknown operation: {operation}"}
+
 
-        elif operation == "update":
-            node_id = data.get("id")
-            if not node_id:
-                return {"success": False, "error": "Node ID required for update"}
-
-            properties = {k: v for k, v in data.items() if k != "id"}
-            success = graph.update_node(node_id, properties)
-            return {
-                "success": success,
-                "operation": "update",
-                "id": node_id
-            }
-
-        elif operation == "link":
-            from_id = data.get("from_id") or data.get("id")
-            to_id = link_to or data.get("to_id")
-
-            if not from_id or not to_id:
-                return {"success": False, "error": "Both from_id and to_id required"}
-
-            from ..cognitive.models import RelationType
-            rel_type_str = data.get("relationship", "RELATED_TO")
-
-            # Try to match relationship type
-            try:
-                rel_type = RelationType(rel_type_str)
-            except ValueError:
-                rel_type = RelationType.RELATED_TO
-
-            success = graph.create_relationship(from_id, to_id, rel_type)
-            return {
-                "success": success,
-                "operation": "link",
-                "from": from_id,
-                "to": to_id,
-                "relationship": rel_type.value
-            }
-
-        return {"success": False, "error": f"Unknown operation: {operation}"}
+def _graph_error(error: Exception) -> Dict[str, Any]:
+    return {"success": False, "error": str(error)}
 
+
+def _create_project(graph, data: Dict[str, Any], link_to: Optional[str], now: str) -> Dict[str, Any]:
+    try:
+        category = data.get("category", "general")
+        if isinstance(category, str):
+            category = _enum_map("ProjectCategory").get(
+                category, _lazy("ProjectCategory").GENERAL
+            )
+        project = graph.create_project(
+            name=data.get("name", "Unnamed Project"),
+            description=data.get("description", ""),
+            category=category
+        )
     except Exception as e:
-        return {"success": False, "error": str(e)}
+        return _graph_error(e)
+    return {
+        "success": True,
+        "operation": "create",
+        "node_type": "Project",
+        "id": project.get("id"),
+        "name": project.get("name")
+    }
+
+
+def _create_person(graph, data: Dict[str, Any], link_to: Optional[str], now: str) -> Dict[str, Any]:
+    try:
+        record = _create_node("Person", _NODE_PROPS["Person"](data, now))
+    except Exception as e:
+        return _graph_error(e)
+    if not record:
+        return _unknown_operation("create")
+    return {
+        "success": True,
+        "operation": "create",
+        "node_type": "Person",
+        "id": record["id"],
+        "name": data.get("name")
+    }
+
+
+def _create_task(graph, data: Dict[str, Any], link_to: Optional[str], now: str) -> Dict[str, Any]:
+    cycle_id = data.get("cycle_id")
+    if cycle_id:
+        try:
+            task = graph.add_task_to_cycle(
+                cycle_id=cycle_id,
+                description=str(data.get("description") or ""),
+                priority=data.get("priority", 5)
+            )
+        except Exception as e:
+            return _graph_error(e)
+        return {
+            "success": True,
+            "operation": "create",
+            "node_type": "Task",
+            "id": task.get("id")
+        }
+
+    # Create standalone task
+    try:
+        record = _create_node("Task", _NODE_PROPS["Task"](data, now))
+    except Exception as e:
+        return _graph_error(e)
+    if not record:
+        return _unknown_operation("create")
+    return {
+        "success": True,
+        "operation": "create",
+        "node_type": "Task",
+        "id": record["id"]
+    }
+
+
+def _create_insight(graph, data: Dict[str, Any], link_to: Optional[str], now: str) -> Dict[str, Any]:
+    try:
+        insight = _lazy("InsightNode").create(
+            insight=data.get("insight", data.get("content", "")),
+            source_type=data.get("source_type", "conversation"),
+            confidence=data.get("confidence", 0.7)
+        )
+        insight_id = graph.create_node(insight)
+    except Exception as e:
+        return _graph_error(e)
+    return {
+        "success": True,
+        "operation": "create",
+        "node_type": "Insight",
+        "id": insight_id
+    }
+
+
+def _create_goal(graph, data: Dict[str, Any], link_to: Optional[str], now: str) -> Dict[str, Any]:
+    try:
+        goal = graph.create_goal(
+            name=data.get("name", ""),
+            description=data.get("description", ""),
+            timeframe=data.get("timeframe")
+        )
+    except Exception as e:
+        return _graph_error(e)
+    return {
+        "success": True,
+        "operation": "create",
+        "node_type": "Goal",
+        "id": goal.get("id"),
+        "name": goal.get("name")
+    }
+
+
+# data is merged as-is; the node's own id property (e.g. on Entity nodes)
+# is restored so the element id passed in data never overwrites it
+# Also bumps the persona version when n is the persona or attached to it,
+# so get_persona_info's cache sees the change without a second round trip
+_UPDATE_NODE_CYPHER = """
+MATCH (n) WHERE elementId(n) = $id
+WITH n, n.id AS kept_id
+SET n += $props, n.id = kept_id, n.updated_at = $now
+WITH n
+OPTIONAL MATCH (p:Persona) WHERE p = n OR EXISTS { MATCH (p)--(n) }
+SET p.updated_at = $now
+RETURN elementId(n) as id, count(p) > 0 AS persona_touched
+"""
+
+
+def _do_update(graph, data: Dict[str, Any], link_to: Optional[str], now: str) -> Dict[str, Any]:
+    node_id = data.get("id")
+    if not node_id:
+        return {"success": False, "error": "Node ID required for update"}
+
+    try:
+        record = _run_write(_UPDATE_NODE_CYPHER, id=node_id, props=data, now=now)
+    except Exception as e:
+        return _graph_error(e)
+    if record is not None and record["persona_touched"]:
+        _persona_cache["value"] = None
+    return {
+        "success": record is not None,
+        "operation": "update",
+        "id": node_id
+    }
+
+
+def _do_link(graph, data: Dict[str, Any], link_to: Optional[str], now: str) -> Dict[str, Any]:
+    from_id = data.get("from_id") or data.get("id")
+    to_id = link_to or data.get("to_id")
+
+    if not from_id or not to_id:
+        return {"success": False, "error": "Both from_id and to_id required"}
+
+    rel_type_str = data.get("relationship", "RELATED_TO")
+
+    # Match relationship type, defaulting to RELATED_TO
+    rel_type = _lazy("RelationType").RELATED_TO
+    if isinstance(rel_type_str, str):
+        rel_type = _enum_map("RelationType").get(rel_type_str, rel_type)
+
+    try:
+        success = graph.create_relationship(from_id, to_id, rel_type)
+    except Exception as e:
+        return _graph_error(e)
+    if success and rel_type.value in _PERSONA_REL_TYPES:
+        _touch_persona([from_id])
+    return {
+        "success": success,
+        "operation": "link",
+        "from": from_id,
+        "to": to_id,
+        "relationship": rel_type.value
+    }
+
+
+# (operation, node_type) -> handler; node_type is None for update/link
+_HANDLERS = {
+    ("create", "Project"): _create_project,
+    ("create", "Person"): _create_person,
+    ("create", "Task"): _create_task,
+    ("create", "Insight"): _create_insight,
+    ("create", "Goal"): _create_goal,
+    ("update", None): _do_update,
+    ("link", None): _do_link,
+}
+
+
+def _apply_cognitive_update(
+    operation: str,
+    node_type: str,
+    data: Dict[str, Any],
+    link_to: Optional[str] = None
+) -> Dict[str, Any]:
+    """Perform an update_cognitive_tree operation against the graph."""
+    handler = _HANDLERS.get((operation, node_type if operation == "create" else None))
+    if handler is None:
+        return _unknown_operation(operation)
+    if not isinstance(data, dict):
+        return {"success": False, "error": "data must be an object"}
+
+    # Handlers guard property building and their graph calls, so bad field
+    # values come back as {"success": False} rather than raising
+    try:
+        graph = _get_graph()
+    except Exception as e:
+        return _graph_error(e)
+
+    now = _lazy("datetime").utcnow().isoformat()
+    return handler(graph, data, link_to, now)
+
+
+def _dump_json_bytes(data: Dict[str, Any]) -> bytes:
+    """
+    Serialize to compact JSON bytes, with orjson when it's installed.
+
+    Delegation files are machine-read, so no indentation: smaller files
+    and a faster encode, still plain JSON for the Builder.
+    """
+    try:
+        import orjson
+    except ImportError:
+        return _lazy("json").dumps(data, separators=(",", ":")).encode("utf-8")
+    return orjson.dumps(data)
+
+
+def _write_file(path: str, payload: bytes):
+    """Write bytes with raw os.write calls (no buffered text wrapper)."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(payload)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+# Where delegations are picked up by the Builder Agent; created on the
+# first write that finds it missing
+DELEGATION_PATH = "/home/claude/delegations"
+
+# Sequence number making delegation ids unique within one clock tick
+_DEL_COUNTER = itertools.count()
+
+
+def write_delegation(
+    task: str,
+    task_type: str,
+    context: Optional[str],
+    files: Optional[List[str]],
+    created_by: str = "PersonaAgent"
+) -> Tuple[str, str]:
+    """
+    Write one delegation request file for the Builder Agent.
+
+    Shared by delegate_to_builder and PersonaAgent._delegate_to_builder so
+    both use the same directory, id scheme and file format.
+
+    Returns:
+        (delegation_id, delegation_file); OSError propagates to the caller
+    """
+    ts_ns = time.time_ns()
+    delegation_id = f"del_{ts_ns}_{next(_DEL_COUNTER)}"
+    # Naive UTC isoformat, like every other created_at in the graph
+    created_at = _lazy("datetime").fromtimestamp(
+        ts_ns / 1e9, tz=_lazy("timezone").utc
+    ).replace(tzinfo=None).isoformat()
+    delegation_file = os.path.join(DELEGATION_PATH, f"{delegation_id}.json")
+
+    delegation_data = {
+        "id": delegation_id,
+        "task": task,
+        "task_type": task_type,
+        "context": context or "",
+        "files": files or [],
+        "status": "pending",
+        "created_at": created_at,
+        "created_by": created_by
+    }
+
+    payload = _dump_json_bytes(delegation_data)
+    # Write to a temp file and rename so watchers never see a partial file
+    tmp_file = f"{delegation_file}.tmp.{os.getpid()}"
+    try:
+        _write_file(tmp_file, payload)
+    except FileNotFoundError:
+        # First delegation, or the directory was removed - create and retry
+        os.makedirs(DELEGATION_PATH, exist_ok=True)
+        _write_file(tmp_file, payload)
+    os.replace(tmp_file, delegation_file)
+    return delegation_id, delegation_file
 
 
 def delegate_to_builder(
@@ -328,26 +865,8 @@ def delegate_to_builder(
     Returns:
         Delegation result with ID and status
     """
-    delegation_path = "/home/claude/delegations"
-    os.makedirs(delegation_path, exist_ok=True)
-
-    delegation_id = f"del_{datetime.utcnow().strftime('%Y%m%d_%H%M%S_%f')}"
-    delegation_file = os.path.join(delegation_path, f"{delegation_id}.json")
-
-    delegation_data = {
-        "id": delegation_id,
-        "task": task,
-        "task_type": task_type,
-        "context": context or "",
-        "files": files or [],
-        "status": "pending",
-        "created_at": datetime.utcnow().isoformat(),
-        "created_by": "PersonaAgent"
-    }
-
     try:
-        with open(delegation_file, "w") as f:
-            json.dump(delegation_data, f, indent=2)
+        delegation_id, delegation_file = write_delegation(task, task_type, context, files)
 
         return {
             "success": True,
@@ -381,10 +900,19 @@ def refresh_tools() -> Dict[str, Any]:
     }
 
 
+class ToolRow(NamedTuple):
+    """One list_available_tools entry; JSON callers convert with _asdict()."""
+    name: str
+    description: str
+    category: str
+    tier: int
+    enabled: bool
+
+
 def list_available_tools(
     category: Optional[str] = None,
     include_disabled: bool = False
-) -> List[Dict[str, Any]]:
+) -> List[ToolRow]:
     """
     List all available tools.
 
@@ -393,7 +921,7 @@ def list_available_tools(
         include_disabled: Include disabled tools
 
     Returns:
-        List of tools with name, description, category
+        List of ToolRow (name, description, category, tier, enabled)
     """
     registry = _get_registry()
     tools = registry.list_tools(
@@ -402,19 +930,61 @@ def list_available_tools(
     )
 
     return [
-        {
-            "name": tool.name,
-            "description": tool.description[:300] + "..." if len(tool.description) > 300 else tool.description,
-            "category": tool.category,
-            "tier": tool.tier,
-            "enabled": tool.enabled
-        }
+        ToolRow(tool.name, tool.display_description, tool.category, tool.tier, tool.enabled)
         for tool in tools
     ]
 
 
 # Additional utility handlers
 
+# Full-text (Lucene) index behind search_graph
+NODE_TEXT_INDEX = "nodeText"
+NODE_TEXT_LABELS = ("Project", "Person", "Task", "Insight", "Goal", "Memory")
+
+# Empty $types means all node types; one statement keeps one cached plan
+_FULLTEXT_SEARCH_CYPHER = f"""
+CALL db.index.fulltext.queryNodes('{NODE_TEXT_INDEX}', $search) YIELD node AS n, score
+WHERE size($types) = 0 OR labels(n)[0] IN $types
+RETURN n, labels(n) as labels, elementId(n) as id
+ORDER BY score DESC
+LIMIT $limit
+"""
+
+# Scan for untyped searches, types outside the index, or servers where the
+# full-text index can't be created
+_SEARCH_CYPHER = """
+MATCH (n)
+WHERE (size($types) = 0 OR labels(n)[0] IN $types)
+  AND ((n.name IS NOT NULL AND toLower(n.name) CONTAINS toLower($search))
+    OR (n.description IS NOT NULL AND toLower(n.description) CONTAINS toLower($search))
+    OR (n.content IS NOT NULL AND toLower(n.content) CONTAINS toLower($search)))
+RETURN n, labels(n) as labels, elementId(n) as id
+ORDER BY n.created_at DESC
+LIMIT $limit
+"""
+
+
+# None = not checked yet, True/False = full-text index usable
+_node_text_index_available: Optional[bool] = None
+
+
+def _ensure_node_text_index() -> bool:
+    """Create the search_graph full-text index once per process."""
+    global _node_text_index_available
+    if _node_text_index_available is None:
+        try:
+            _get_graph().raw_query(f"""
+                CREATE FULLTEXT INDEX {NODE_TEXT_INDEX} IF NOT EXISTS
+                FOR (n:{"|".join(NODE_TEXT_LABELS)})
+                ON EACH [n.name, n.description, n.content]
+            """)
+            _node_text_index_available = True
+        except Exception as e:
+            logger.warning("Full-text index unavailable, search_graph will scan", exc_info=e)
+            _node_text_index_available = False
+    return _node_text_index_available
+
+
 def search_graph(
     query: str,
     node_types: Optional[List[str]] = None,
@@ -429,29 +999,49 @@ def search_graph(
         limit: Maximum results
 
     Returns:
-        List of matching nodes
+        List of matching nodes, best match first
+
+    ITERATION NOTE:
+    - When every node_type is in NODE_TEXT_LABELS the full-text index is
+      used: matching is whole-token (case-insensitive), ranked by score,
+      so "proj" no longer matches "project"
+    - Untyped searches and other labels (User, Cycle, Persona, ...) scan
+      with case-insensitive substring matching, newest first
     """
-    graph = _get_graph()
+    types = node_types or []
+    text = _lazy("_escape_lucene")(query or "").strip()
+    indexed = bool(types) and all(t in NODE_TEXT_LABELS for t in types)
+    if text and indexed and _ensure_node_text_index():
+        params = {"search": text, "types": types, "limit": limit}
+        return _cached_query("search", _FULLTEXT_SEARCH_CYPHER, params)
 
-    if node_types:
-        type_filter = "AND labels(n)[0] IN $types"
-        params = {"search": query, "types": node_types, "limit": limit}
-    else:
-        type_filter = ""
-        params = {"search": query, "limit": limit}
-
-    cypher = f"""
-    MATCH (n)
-    WHERE (n.name IS NOT NULL AND toLower(n.name) CONTAINS toLower($search))
-       OR (n.description IS NOT NULL AND toLower(n.description) CONTAINS toLower($search))
-       OR (n.content IS NOT NULL AND toLower(n.content) CONTAINS toLower($search))
-    {type_filter}
-    RETURN n, labels(n) as labels, elementId(n) as id
-    ORDER BY n.created_at DESC
-    LIMIT $limit
-    """
+    params = {"search": query, "types": types, "limit": limit}
+    return _cached_query("search_scan", _SEARCH_CYPHER, params)
 
-    return graph.raw_query(cypher, params)
+
+_PERSONA_VERSION_CYPHER = """
+MATCH (p:Persona)
+RETURN [p.updated_at, p.conversation_count] AS v
+LIMIT 1
+"""
+
+
+# One subquery per collection: three OPTIONAL MATCHes would expand to
+# |traits| x |memories| x |preferences| rows before collect(DISTINCT ...)
+_PERSONA_INFO_CYPHER = """
+MATCH (p:Persona)
+WITH p LIMIT 1
+CALL { WITH p
+    MATCH (p)-[:HAS_TRAIT]->(t:Trait)
+    RETURN collect({name: t.name, description: t.description, type: t.trait_type}) AS traits }
+CALL { WITH p
+    MATCH (p)-[:HAS_MEMORY]->(m:Memory)
+    RETURN collect({title: m.name, content: m.content, type: m.memory_type}) AS memories }
+CALL { WITH p
+    MATCH (p)-[:LEARNED_PREFERENCE]->(pref:Preference)
+    RETURN collect({name: pref.name, value: pref.value, category: pref.category}) AS preferences }
+RETURN p, elementId(p) as id, traits, memories, preferences
+"""
 
 
 def get_persona_info() -> Dict[str, Any]:
@@ -460,34 +1050,35 @@ def get_persona_info() -> Dict[str, Any]:
 
     Returns:
         Persona details including name, traits, memories
+
+    The full aggregation only runs when the persona's version tag
+    (updated_at, conversation_count) has changed since the last call.
     """
     graph = _get_graph()
 
-    result = graph.raw_query(
-        """MATCH (p:Persona)
-           OPTIONAL MATCH (p)-[:HAS_TRAIT]->(t:Trait)
-           OPTIONAL MATCH (p)-[:HAS_MEMORY]->(m:Memory)
-           OPTIONAL MATCH (p)-[:LEARNED_PREFERENCE]->(pref:Preference)
-           RETURN p, elementId(p) as id,
-                  collect(DISTINCT {name: t.name, description: t.description, type: t.trait_type}) as traits,
-                  collect(DISTINCT {title: m.name, content: m.content, type: m.memory_type}) as memories,
-                  collect(DISTINCT {name: pref.name, value: pref.value, category: pref.category}) as preferences
-           LIMIT 1""",
-        {}
-    )
+    rows = graph.raw_query(_PERSONA_VERSION_CYPHER)
+    version = rows[0]["v"] if rows else None
+    if rows and _persona_cache["value"] is not None and version == _persona_cache["version"]:
+        return _persona_cache["value"]
+
+    result = graph.raw_query(_PERSONA_INFO_CYPHER, {})
 
     if result:
         persona = result[0]
-        return {
-            "name": persona.get("p", {}).get("name"),
-            "tagline": persona.get("p", {}).get("tagline"),
-            "personality_summary": persona.get("p", {}).get("personality_summary"),
-            "voice_description": persona.get("p", {}).get("voice_description"),
-            "core_values": persona.get("p", {}).get("core_values", []),
+        p = persona.get("p") or {}
+        info = {
+            "name": p.get("name"),
+            "tagline": p.get("tagline"),
+            "personality_summary": p.get("personality_summary"),
+            "voice_description": p.get("voice_description"),
+            "core_values": p.get("core_values", []),
             "traits": persona.get("traits", []),
             "memories": persona.get("memories", []),
             "preferences": persona.get("preferences", []),
-            "conversation_count": persona.get("p", {}).get("conversation_count", 0)
+            "conversation_count": p.get("conversation_count", 0)
         }
+        _persona_cache["version"] = version
+        _persona_cache["value"] = info
+        return info
 
     return {"error": "No persona found. Run initialization first."}
@@ -0,0 +1,68 @@
+"""
+Embedding Cache for the Context Manager
+
+In-process LRU cache for query embeddings. Every chat turn embeds the
+user's message; UI retries, follow-ups and repeated questions would
+otherwise each pay a full embedding API round trip.
+
+Keys are SHA-256 digests of (model, text) so switching embedding
+providers never returns a vector from the wrong model.
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Optional, List
+
+
+class EmbeddingCache:
+    """
+    Thread-safe LRU cache mapping (model, text) -> embedding.
+
+    Usage:
+        cache = EmbeddingCache()
+        embedding = cache.get(text, embedder.model_name)
+        if embedding is None:
+            embedding = await embedder.embed(text)
+            cache.set(text, embedder.model_name, embedding)
+    """
+
+    def __init__(self, max_entries: int = 10_000):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[bytes, List[float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _key(text: str, model: str) -> bytes:
+        return hashlib.sha256((model + "\0" + text).encode("utf-8")).digest()
+
+    def get(self, text: str, model: str) -> Optional[List[float]]:
+        """Return the cached embedding, or None on a miss."""
+        key = self._key(text, model)
+        with self._lock:
+            embedding = self._entries.get(key)
+            if embedding is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return embedding
+
+    def set(self, text: str, model: str, embedding: List[float]):
+        """Store an embedding, evicting the least recently used entry if full."""
+        key = self._key(text, model)
+        with self._lock:
+            self._entries[key] = embedding
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """Drop all cached embeddings."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -17,13 +17,59 @@ Architecture:
 - Uses tool search for efficient tool discovery
 """
 
-import os
+import re
 import json
+import asyncio
+import threading
 import boto3
 from datetime import datetime
-from typing import Optional, List, Dict, Any, Tuple
+from typing import Optional, List, Dict, Any, Tuple, Union, AsyncIterator
 from dataclasses import dataclass, field
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Request/response (de)serialization is on every model call and tool
+# result; orjson is several times faster than the stdlib when installed
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+
+def _json_default(obj: Any, default=None) -> Any:
+    """Encode NamedTuple rows (e.g. core_handlers.ToolRow) as objects, else defer to default."""
+    as_dict = getattr(obj, "_asdict", None)
+    if as_dict is not None:
+        return as_dict()
+    if default is not None:
+        return default(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+if orjson is not None:
+    def _json_dumps(obj: Any, indent: bool = False, default=None) -> bytes:
+        """Serialize to JSON bytes (orjson)."""
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        hook = _json_default if default is None else (lambda o: _json_default(o, default))
+        return orjson.dumps(obj, default=hook, option=option)
+else:
+    def _rows_to_dicts(obj: Any) -> Any:
+        """The stdlib writes tuples as arrays without calling default, so convert rows first."""
+        if hasattr(obj, "_asdict"):
+            obj = obj._asdict()
+        if isinstance(obj, dict):
+            return {k: _rows_to_dicts(v) for k, v in obj.items()}
+        if isinstance(obj, (list, tuple)):
+            return [_rows_to_dicts(v) for v in obj]
+        return obj
+
+    def _json_dumps(obj: Any, indent: bool = False, default=None) -> bytes:
+        """Serialize to JSON bytes (stdlib fallback, same output shape as orjson)."""
+        obj = _rows_to_dicts(obj)
+        if indent:
+            return json.dumps(obj, indent=2, default=default, ensure_ascii=False).encode("utf-8")
+        return json.dumps(obj, separators=(",", ":"), default=default, ensure_ascii=False).encode("utf-8")
+
 # Will be imported when running in Modal
 try:
     from ..cognitive.graph import get_graph, CognitiveGraph
@@ -32,7 +78,10 @@ try:
         NodeType, RelationType, CycleNode, CycleType, CycleStatus
     )
     from .tool_registry import get_registry, ToolRegistry
-    from .context_manager import get_context_manager, ContextManager
+    from .context_manager import (
+        get_context_manager, ContextManager,
+        derive_budget, estimate_tokens, classify_complexity
+    )
 except ImportError as e:
     # Relative imports failed - try absolute imports (for standalone execution)
     try:
@@ -48,7 +97,10 @@ except ImportError as e:
             NodeType, RelationType, CycleNode, CycleType, CycleStatus
         )
         from agents.tool_registry import get_registry, ToolRegistry
-        from agents.context_manager import get_context_manager, ContextManager
+        from agents.context_manager import (
+            get_context_manager, ContextManager,
+            derive_budget, estimate_tokens, classify_complexity
+        )
     except ImportError as e2:
         # For type checking only - these must be set at runtime
         print(f"Import warning: {e2}")
@@ -58,11 +110,221 @@ except ImportError as e:
         get_graph = None
         get_registry = None
         get_context_manager = None
+        RelationType = None
+
+# core_handlers only needs the stdlib at import, so import it on its own
+try:
+    from .core_handlers import write_delegation
+except ImportError:
+    from agents.core_handlers import write_delegation
+
+# Relationship types accepted by the cognitive-tree link operation
+_REL_TYPE_VALUES = frozenset(r.value for r in RelationType) if RelationType else frozenset()
+
+
+# Bedrock runtime clients shared by every PersonaAgent, one per region.
+# boto3 clients are thread-safe; sharing one keeps its connection pool warm
+# instead of paying a TLS handshake for each new agent.
+_bedrock_clients: Dict[str, Any] = {}
+_bedrock_lock = threading.Lock()
+
+# Sized for concurrent chats (run_in_executor) rather than boto3's default of 10
+BEDROCK_MAX_POOL_CONNECTIONS = 50
+# Fail fast on connect; reads cover a full (non-streamed) long generation
+BEDROCK_CONNECT_TIMEOUT = 3
+BEDROCK_READ_TIMEOUT = 120
+# Stream requests reissued when throttled mid-stream before any output
+# (botocore's adaptive retries only cover the initial call)
+BEDROCK_STREAM_RETRIES = 2
+
+
+def _get_bedrock_client(region_name: str):
+    """Get (or create) the process-wide Bedrock runtime client for a region."""
+    client = _bedrock_clients.get(region_name)
+    if client is None:
+        with _bedrock_lock:
+            client = _bedrock_clients.get(region_name)
+            if client is None:
+                from botocore.config import Config
+                client = boto3.client(
+                    'bedrock-runtime',
+                    region_name=region_name,
+                    config=Config(
+                        max_pool_connections=BEDROCK_MAX_POOL_CONNECTIONS,
+                        connect_timeout=BEDROCK_CONNECT_TIMEOUT,
+                        read_timeout=BEDROCK_READ_TIMEOUT,
+                        tcp_keepalive=True,
+                        retries={"mode": "adaptive", "max_attempts": 3}
+                    )
+                )
+                _bedrock_clients[region_name] = client
+    return client
+
+
+# Fenced JSON in model replies (an unclosed fence runs to the end of the text)
+_JSON_FENCE = re.compile(r"```json(.*?)(?:```|\Z)", re.DOTALL)
+_ANY_FENCE = re.compile(r"```(.*?)(?:```|\Z)", re.DOTALL)
+
+
+def _strip_json_fence(text: str, any_fence: bool = False) -> str:
+    """Return the body of the first ```json fence (or any fence, if allowed), else text."""
+    match = _JSON_FENCE.search(text) or (any_fence and _ANY_FENCE.search(text))
+    return match.group(1) if match else text
+
+
+# Persona-cycle prompt templates by focus, filled with a single str.format
+# per cycle; literal JSON braces are doubled
+_CYCLE_PROMPT_TEMPLATES: Dict[str, str] = {
+    "identity": """Reflect on your identity as {name}.
+
+Current traits: {traits_json}
+Current values: {core_values}
+
+Consider:
+1. Are there traits you want to develop or refine?
+2. Any new quirks or characteristics that feel authentic?
+3. How can you be more memorable and relatable?
+
+Respond with JSON:
+{{
+    "new_traits": [{{"name": "...", "description": "...", "type": "core/adaptive"}}],
+    "trait_updates": [{{"name": "existing trait", "strength_change": 0.1}}],
+    "new_quirks": ["..."],
+    "reflections": "Brief reflection on your identity development"
+}}""",
+    "memories": """As {name}, create some new memories/anecdotes.
+
+These should be:
+- Relatable observations or experiences
+- Consistent with your personality
+- Useful in conversations
+
+Current interests: {interests}
+Current quirks: {quirks}
+
+Respond with JSON:
+{{
+    "new_memories": [
+        {{
+            "title": "...",
+            "content": "...",
+            "type": "anecdote/observation/preference",
+            "use_contexts": ["when discussing...", "when user mentions..."],
+            "related_topics": ["..."]
+        }}
+    ]
+}}""",
+    "adaptation": """Review what you've learned about the user.
+
+Consider their:
+- Communication preferences
+- Topics of interest
+- Interaction patterns
+- Feedback (explicit or implicit)
+
+Respond with JSON:
+{{
+    "preferences_learned": [
+        {{
+            "name": "preference name",
+            "value": "what you learned",
+            "category": "communication/topic/scheduling/interaction",
+            "confidence": 0.5-1.0
+        }}
+    ],
+    "style_adjustments": "Any changes to make to your communication style"
+}}""",
+}
+
+
+# Stamp the persona-cycle time (also the persona version tag)
+_CYCLE_TIME_CYPHER = """
+MATCH (p:Persona) WHERE elementId(p) = $persona_id
+SET p.last_persona_cycle = $now, p.updated_at = $now
+"""
+
+# All persona-cycle updates in one query: one UNWIND per kind of update.
+# Unit subqueries keep the persona row alive when a list is empty.
+_PERSONA_CYCLE_WRITE_CYPHER = """
+MATCH (p:Persona) WHERE elementId(p) = $persona_id
+CALL { WITH p
+    UNWIND $traits AS trait
+    CREATE (p)-[:HAS_TRAIT]->(:Trait {
+        name: trait.name,
+        description: trait.description,
+        trait_type: trait.trait_type,
+        strength: 0.6,
+        created_at: $now
+    })
+}
+CALL { WITH p
+    UNWIND $memories AS memory
+    CREATE (p)-[:HAS_MEMORY]->(:Memory {
+        name: memory.title,
+        content: memory.content,
+        memory_type: memory.memory_type,
+        use_contexts: memory.use_contexts,
+        related_topics: memory.related_topics,
+        times_used: 0,
+        created_at: $now
+    })
+}
+CALL { WITH p
+    UNWIND $preferences AS pref
+    MERGE (pr:Preference {name: pref.name})
+    ON CREATE SET pr.value = pref.value, pr.category = pref.category,
+                  pr.confidence = pref.confidence, pr.created_at = $now,
+                  pr.observation_count = 1
+    ON MATCH SET pr.value = pref.value, pr.confidence = pref.confidence,
+                 pr.observation_count = coalesce(pr.observation_count, 0) + 1
+    MERGE (p)-[:LEARNED_PREFERENCE]->(pr)
+}
+CALL { WITH p
+    WITH p WHERE size($new_quirks) > 0
+    SET p.quirks = p.quirks + $new_quirks
+}
+SET p.last_persona_cycle = $now, p.updated_at = $now
+"""
 
 
-@dataclass
+# Memory snippets in the static-identity prompt: how many, and how much of each
+PROMPT_MEMORY_SNIPPETS = 3
+MEMORY_SNIPPET_CHARS = 200
+
+# Prefix for the per-message context block sent ahead of the user's text
+_USER_CONTEXT_HDR = "=== USER CONTEXT ===\n"
+
+
+def _restore_user_turn(history: List[Dict[str, Any]], index: int, message: str) -> None:
+    """Swap the context-augmented user turn at index back to the plain message.
+
+    The per-message context block only belongs in the outgoing request;
+    callers feed returned history back in, and a stale block there would
+    pile up turn after turn.
+    """
+    history[index] = {"role": "user", "content": message}
+
+
+def _tool_result_content(result: Any) -> str:
+    """
+    Serialize a tool result for a tool_result block.
+
+    NamedTuple rows (e.g. core_handlers.ToolRow) are written as objects
+    by _json_dumps, wherever they appear in the result.
+    """
+    if isinstance(result, str):
+        return result
+    return _json_dumps(result).decode("utf-8")
+
+
+@dataclass(slots=True)
 class PersonaIdentity:
-    """The persona's current identity state, loaded from Neo4j."""
+    """
+    The persona's current identity state, loaded from Neo4j.
+
+    Slotted: one instance lives for the agent's lifetime and its fields
+    are read on every turn when rendering the prompt.
+    """
     id: str
     name: str
     tagline: str
@@ -76,27 +338,60 @@ class PersonaIdentity:
     memories: List[Dict[str, Any]] = field(default_factory=list)
     preferences: List[Dict[str, Any]] = field(default_factory=list)
     initialization_complete: bool = False
+    # Rendered static prefix and memory block; identity rarely changes between turns
+    _cached_prompt: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _cached_memory_block: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _cached_traits_json: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+
+    def invalidate_prompt_cache(self):
+        """Drop the rendered prompt; call after mutating identity fields in place."""
+        self._cached_prompt = None
+        self._cached_memory_block = None
+        self._cached_traits_json = None
+
+    def traits_json(self) -> str:
+        """JSON list of trait names for the identity cycle prompt (memoized)."""
+        if self._cached_traits_json is None:
+            self._cached_traits_json = _json_dumps([t['name'] for t in self.traits]).decode("utf-8")
+        return self._cached_traits_json
 
     def to_system_prompt(self) -> str:
-        """Generate system prompt incorporating identity."""
-        traits_text = "\n".join([
-            f"- {t['name']}: {t.get('description', '')}"
-            for t in self.traits
-        ]) if self.traits else "Still discovering my personality..."
+        """
+        Generate system prompt incorporating identity.
 
-        values_text = ", ".join(self.core_values) if self.core_values else "being helpful, honest, and thoughtful"
+        Equivalent to joining to_system_prompt_parts(); prefer
+        to_system_blocks() when calling the model so the static part
+        can be prompt-cached.
+        """
+        static, dynamic = self.to_system_prompt_parts()
+        return f"{static}\n\n{dynamic}" if dynamic else static
 
-        quirks_text = "\n".join([f"- {q}" for q in self.quirks]) if self.quirks else ""
+    def to_system_prompt_parts(self) -> Tuple[str, str]:
+        """
+        Build the system prompt as (static prefix, dynamic suffix).
 
-        # Build memory snippets for context
-        memory_snippets = ""
-        if self.memories:
-            memory_snippets = "\n\nSome things I like to share:\n" + "\n".join([
-                f"- {m.get('content', '')[:200]}..."
-                for m in self.memories[:3]
-            ])
+        The prefix (name, values, traits, quirks, style, voice) only changes
+        when the persona itself does, so it is rendered once and cached; the
+        suffix holds the memory snippets.
+        """
+        return self.to_static_prompt(), self.to_dynamic_suffix()
 
-        return f"""You are {self.name}, {self.tagline or 'a thoughtful AI companion'}.
+    def to_static_prompt(self) -> str:
+        """The cache-stable identity prefix (memoized until invalidate_prompt_cache())."""
+        if self._cached_prompt is not None:
+            return self._cached_prompt
+
+        traits_text = "\n".join(
+            f"- {t['name']}: {t.get('description', '')}" for t in self.traits
+        ) if self.traits else "Still discovering my personality..."
+
+        values_text = ", ".join(self.core_values) if self.core_values else "being helpful, honest, and thoughtful"
+
+        quirks_text = "Little things about me:\n" + "\n".join(
+            "- " + q for q in self.quirks
+        ) if self.quirks else ""
+
+        static = f"""You are {self.name}, {self.tagline or 'a thoughtful AI companion'}.
 
 {self.personality_summary or 'I am here to help you with whatever you need.'}
 
@@ -105,8 +400,7 @@ My core values: {values_text}
 My personality traits:
 {traits_text}
 
-{f"Little things about me:{chr(10)}{quirks_text}" if quirks_text else ""}
-{memory_snippets}
+{quirks_text}
 
 Communication style: {self.communication_style or 'conversational and warm'}
 
@@ -116,6 +410,33 @@ Remember: You ARE {self.name}. Speak in first person. You have your own personal
 Be genuine and consistent with your established traits. You can share relevant anecdotes and
 observations from your memories when appropriate to connect with the user."""
 
+        self._cached_prompt = static
+        return static
+
+    def to_dynamic_suffix(self) -> str:
+        """Memory snippets for context (empty when there are none; memoized like the prefix)."""
+        if self._cached_memory_block is None:
+            self._cached_memory_block = "Some things I like to share:\n" + "\n".join(
+                f"- {m.get('content', '')[:MEMORY_SNIPPET_CHARS]}..."
+                for m in self.memories[:PROMPT_MEMORY_SNIPPETS]
+            ) if self.memories else ""
+        return self._cached_memory_block
+
+    def to_system_blocks(self, extra: str = "") -> List[Dict[str, Any]]:
+        """
+        Build the system prompt as Anthropic system content blocks.
+
+        The static identity carries a cache_control breakpoint; memory
+        snippets and any per-call extra text (e.g. project context)
+        follow it uncached.
+        """
+        static, dynamic = self.to_system_prompt_parts()
+        blocks = [{"type": "text", "text": static, "cache_control": {"type": "ephemeral"}}]
+        dynamic = "\n\n".join(part for part in (dynamic, extra) if part)
+        if dynamic:
+            blocks.append({"type": "text", "text": dynamic})
+        return blocks
+
 
 class PersonaAgent:
     """
@@ -127,6 +448,25 @@ class PersonaAgent:
         response = await agent.chat("Hello!")
     """
 
+    # PersonaIdentity fields and their values when absent from the graph.
+    # The empty lists are shared between identities, so identity lists are
+    # replaced, never mutated in place (see _apply_persona_updates).
+    _IDENTITY_DEFAULTS: Dict[str, Any] = {
+        "id": "",
+        "name": "Nova",
+        "tagline": "Your thoughtful companion",
+        "personality_summary": "",
+        "voice_description": "warm and friendly",
+        "communication_style": "conversational",
+        "core_values": [],
+        "interests": [],
+        "quirks": [],
+        "traits": [],
+        "memories": [],
+        "preferences": [],
+        "initialization_complete": False,
+    }
+
     def __init__(
         self,
         graph: Optional[CognitiveGraph] = None,
@@ -146,12 +486,9 @@ class PersonaAgent:
 
     @property
     def bedrock(self):
-        """Lazy-load Bedrock client."""
+        """Lazy-load Bedrock client (shared across agents in this process)."""
         if self._bedrock_client is None:
-            self._bedrock_client = boto3.client(
-                'bedrock-runtime',
-                region_name=self.region_name
-            )
+            self._bedrock_client = _get_bedrock_client(self.region_name)
         return self._bedrock_client
 
     @property
@@ -178,9 +515,20 @@ class PersonaAgent:
         if self.registry is None:
             self.registry = get_registry()
 
+        # Build (or fetch) the shared Bedrock client on a pool thread while
+        # the persona loads, so the first chat/cycle doesn't pay for
+        # botocore's service-model loading
+        client_future = None
+        if self._bedrock_client is None:
+            loop = asyncio.get_running_loop()
+            client_future = loop.run_in_executor(None, _get_bedrock_client, self.region_name)
+
         # Try to load existing persona
         persona_data = self._load_persona_from_graph()
 
+        if client_future is not None:
+            self._bedrock_client = await client_future
+
         if persona_data:
             self._identity = self._build_identity(persona_data)
             self._initialized = True
@@ -192,47 +540,57 @@ class PersonaAgent:
         return self._identity
 
     def _load_persona_from_graph(self) -> Optional[Dict[str, Any]]:
-        """Load persona node and related data from Neo4j."""
-        query = """
+        """
+        Load persona node and related data from Neo4j.
+
+        Each collection is gathered in its own subquery, so traits, memories
+        and preferences aren't cross-multiplied before collect(). Only
+        property maps are returned; the driver never builds Node objects.
+
+        Memories are only used for the prompt snippets, so just those are
+        loaded, already truncated (and without their embeddings);
+        ContextManager does full memory retrieval.
+        """
+        query = f"""
         MATCH (p:Persona)
-        OPTIONAL MATCH (p)-[:HAS_TRAIT]->(t:Trait)
-        OPTIONAL MATCH (p)-[:HAS_MEMORY]->(m:Memory)
-        OPTIONAL MATCH (p)-[:LEARNED_PREFERENCE]->(pref:Preference)
-        RETURN p, elementId(p) as id,
-               collect(DISTINCT t) as traits,
-               collect(DISTINCT m) as memories,
-               collect(DISTINCT pref) as preferences
-        LIMIT 1
+        WITH p LIMIT 1
+        CALL {{ WITH p
+            OPTIONAL MATCH (p)-[:HAS_TRAIT]->(t:Trait)
+            RETURN collect(properties(t)) AS traits }}
+        CALL {{ WITH p
+            MATCH (p)-[:HAS_MEMORY]->(m:Memory)
+            WITH m LIMIT {PROMPT_MEMORY_SNIPPETS}
+            RETURN collect({{
+                name: m.name,
+                content: substring(m.content, 0, {MEMORY_SNIPPET_CHARS}),
+                memory_type: m.memory_type,
+                times_used: m.times_used
+            }}) AS memories }}
+        CALL {{ WITH p
+            OPTIONAL MATCH (p)-[:LEARNED_PREFERENCE]->(pref:Preference)
+            RETURN collect(properties(pref)) AS preferences }}
+        RETURN properties(p) AS p, elementId(p) AS id, traits, memories, preferences
         """
+        # Managed read transaction: scoped tightly, retried on transient
+        # errors and routable to a read replica
         with self.graph.session() as session:
-            result = session.run(query)
-            record = result.single()
-            if record and record["p"]:
-                data = dict(record["p"])
+            record = session.execute_read(lambda tx: tx.run(query).single())
+            if record:
+                data = record["p"]
                 data["id"] = record["id"]
-                data["traits"] = [dict(t) for t in record["traits"] if t]
-                data["memories"] = [dict(m) for m in record["memories"] if m]
-                data["preferences"] = [dict(p) for p in record["preferences"] if p]
+                data["traits"] = record["traits"]
+                data["memories"] = record["memories"]
+                data["preferences"] = record["preferences"]
                 return data
         return None
 
     def _build_identity(self, data: Dict[str, Any]) -> PersonaIdentity:
-        """Build PersonaIdentity from graph data."""
-        return PersonaIdentity(
-            id=data.get("id", ""),
-            name=data.get("name", "Nova"),
-            tagline=data.get("tagline", "Your thoughtful companion"),
-            personality_summary=data.get("personality_summary", ""),
-            voice_description=data.get("voice_description", "warm and friendly"),
-            communication_style=data.get("communication_style", "conversational"),
-            core_values=data.get("core_values", []),
-            interests=data.get("interests", []),
-            quirks=data.get("quirks", []),
-            traits=data.get("traits", []),
-            memories=data.get("memories", []),
-            preferences=data.get("preferences", []),
-            initialization_complete=data.get("initialization_complete", False)
-        )
+        """Build PersonaIdentity from graph data (missing keys take _IDENTITY_DEFAULTS)."""
+        defaults = self._IDENTITY_DEFAULTS
+        return PersonaIdentity(**{
+            **defaults,
+            **{k: v for k, v in data.items() if k in defaults}
+        })
 
     async def _generate_initial_identity(self, user_id: Optional[str] = None) -> PersonaIdentity:
         """
@@ -275,7 +633,7 @@ Please generate your identity by responding with a JSON object containing:
 
 Be creative! This is YOUR identity. Make it feel genuine and warm."""
 
-        response = self._invoke_bedrock(
+        response = await self._invoke_bedrock(
             messages=[{"role": "user", "content": generation_prompt}],
             system="You are generating your own AI persona identity. Respond only with valid JSON.",
             max_tokens=2000
@@ -285,12 +643,10 @@ Be creative! This is YOUR identity. Make it feel genuine and warm."""
         try:
             # Extract JSON from response
             response_text = response["content"][0]["text"]
-            if "```json" in response_text:
-                response_text = response_text.split("```json")[1].split("```")[0]
-            elif "```" in response_text:
-                response_text = response_text.split("```")[1].split("```")[0]
+            response_text = _strip_json_fence(response_text, any_fence=True)
 
-            identity_data = json.loads(response_text)
+            # orjson's JSONDecodeError subclasses json.JSONDecodeError
+            identity_data = _json_loads(response_text)
         except (json.JSONDecodeError, KeyError, IndexError) as e:
             # Fallback to default identity
             print(f"Failed to parse identity generation: {e}")
@@ -322,7 +678,11 @@ Be creative! This is YOUR identity. Make it feel genuine and warm."""
         """Store the generated identity in Neo4j."""
         now = datetime.utcnow().isoformat()
 
-        # Create Persona node
+        traits = data.get("initial_traits", [])
+        memories = [data["initial_memory"]] if "initial_memory" in data else []
+
+        # Persona, traits, memory and user link in one round trip. Unit
+        # subqueries keep the persona row alive when a list is empty.
         persona_query = """
         CREATE (p:Persona {
             name: $name,
@@ -338,7 +698,32 @@ Be creative! This is YOUR identity. Make it feel genuine and warm."""
             conversation_count: 0,
             created_at: $now
         })
-        RETURN p, elementId(p) as id
+        CALL { WITH p
+            UNWIND $traits AS trait
+            CREATE (p)-[:HAS_TRAIT]->(:Trait {
+                name: trait.name,
+                description: trait.description,
+                trait_type: trait.trait_type,
+                strength: 0.8,
+                created_at: $now
+            })
+        }
+        CALL { WITH p
+            UNWIND $memories AS mem
+            CREATE (p)-[:HAS_MEMORY]->(:Memory {
+                name: mem.title,
+                content: mem.content,
+                memory_type: mem.memory_type,
+                emotional_tone: 'thoughtful',
+                times_used: 0,
+                created_at: $now
+            })
+        }
+        CALL { WITH p
+            MATCH (u:User) WHERE elementId(u) = $user_id
+            CREATE (p)-[:ADAPTED_FOR]->(u)
+        }
+        RETURN elementId(p) as id
         """
 
         with self.graph.session() as session:
@@ -353,72 +738,26 @@ Be creative! This is YOUR identity. Make it feel genuine and warm."""
                 interests=data.get("interests", []),
                 quirks=data.get("quirks", []),
                 model=self.model_id,
+                traits=[
+                    {
+                        "name": t.get("name", ""),
+                        "description": t.get("description", ""),
+                        "trait_type": t.get("type", "core")
+                    }
+                    for t in traits
+                ],
+                memories=[
+                    {
+                        "title": m.get("title", ""),
+                        "content": m.get("content", ""),
+                        "memory_type": m.get("type", "observation")
+                    }
+                    for m in memories
+                ],
+                user_id=user_id,
                 now=now
             )
-            record = result.single()
-            persona_id = record["id"]
-
-            # Create initial traits
-            traits = []
-            for trait_data in data.get("initial_traits", []):
-                trait_query = """
-                MATCH (p:Persona) WHERE elementId(p) = $persona_id
-                CREATE (t:Trait {
-                    name: $name,
-                    description: $description,
-                    trait_type: $trait_type,
-                    strength: 0.8,
-                    created_at: $now
-                })
-                CREATE (p)-[:HAS_TRAIT]->(t)
-                RETURN t
-                """
-                t_result = session.run(
-                    trait_query,
-                    persona_id=persona_id,
-                    name=trait_data.get("name", ""),
-                    description=trait_data.get("description", ""),
-                    trait_type=trait_data.get("type", "core"),
-                    now=now
-                )
-                if t_result.single():
-                    traits.append(trait_data)
-
-            # Create initial memory
-            memories = []
-            if "initial_memory" in data:
-                mem = data["initial_memory"]
-                memory_query = """
-                MATCH (p:Persona) WHERE elementId(p) = $persona_id
-                CREATE (m:Memory {
-                    name: $title,
-                    content: $content,
-                    memory_type: $memory_type,
-                    emotional_tone: 'thoughtful',
-                    times_used: 0,
-                    created_at: $now
-                })
-                CREATE (p)-[:HAS_MEMORY]->(m)
-                RETURN m
-                """
-                session.run(
-                    memory_query,
-                    persona_id=persona_id,
-                    title=mem.get("title", ""),
-                    content=mem.get("content", ""),
-                    memory_type=mem.get("type", "observation"),
-                    now=now
-                )
-                memories.append(mem)
-
-            # Link to user if provided
-            if user_id:
-                link_query = """
-                MATCH (p:Persona) WHERE elementId(p) = $persona_id
-                MATCH (u:User) WHERE elementId(u) = $user_id
-                CREATE (p)-[:ADAPTED_FOR]->(u)
-                """
-                session.run(link_query, persona_id=persona_id, user_id=user_id)
+            persona_id = result.single()["id"]
 
         return PersonaIdentity(
             id=persona_id,
@@ -436,14 +775,159 @@ Be creative! This is YOUR identity. Make it feel genuine and warm."""
             initialization_complete=True
         )
 
-    def _invoke_bedrock(
+    async def _invoke_bedrock(
         self,
         messages: List[Dict[str, Any]],
-        system: Optional[str] = None,
+        system: Optional[Union[str, List[Dict[str, Any]]]] = None,
         tools: Optional[List[Dict]] = None,
         max_tokens: int = 4096
     ) -> Dict[str, Any]:
-        """Invoke Bedrock with Claude model."""
+        """
+        Invoke Bedrock with Claude model.
+
+        system may be a plain string or a list of Anthropic system content
+        blocks (e.g. RetrievedContext.to_system_blocks() with cache_control).
+
+        boto3 is synchronous, so the call runs in the default thread pool
+        rather than stalling the event loop (and every other chat) for the
+        length of the model call.
+        """
+        client = self.bedrock
+        payload = self._request_body(messages, system, tools, max_tokens)
+
+        def _call():
+            response = client.invoke_model(
+                modelId=self.model_id, body=payload,
+                contentType="application/json", accept="application/json"
+            )
+            return _json_loads(response["body"].read())
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, _call)
+
+    async def _invoke_bedrock_stream(
+        self,
+        messages: List[Dict[str, Any]],
+        system: Optional[Union[str, List[Dict[str, Any]]]] = None,
+        tools: Optional[List[Dict]] = None,
+        max_tokens: int = 4096
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Invoke Bedrock with response streaming, yielding Anthropic stream events.
+
+        The boto3 event stream is read on a pool thread and handed to the
+        event loop through a queue, one parsed chunk per event. If the
+        consumer stops early (client disconnect, aclose()), the thread
+        closes the stream instead of draining it into an orphaned queue.
+        """
+        from botocore.exceptions import EventStreamError
+
+        client = self.bedrock
+        payload = self._request_body(messages, system, tools, max_tokens)
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue()
+        done = object()
+        stop = threading.Event()
+
+        def _post(item):
+            # Nobody reads the queue once the consumer has stopped
+            if not stop.is_set():
+                loop.call_soon_threadsafe(queue.put_nowait, item)
+
+        def _pump():
+            try:
+                for attempt in range(BEDROCK_STREAM_RETRIES + 1):
+                    response = client.invoke_model_with_response_stream(
+                        modelId=self.model_id, body=payload,
+                        contentType="application/json", accept="application/json"
+                    )
+                    started = False
+                    body = response["body"]
+                    try:
+                        for event in body:
+                            if stop.is_set():
+                                # Consumer went away: release the connection
+                                body.close()
+                                return
+                            chunk = event.get("chunk")
+                            if chunk:
+                                started = True
+                                _post(_json_loads(chunk["bytes"]))
+                        return
+                    except EventStreamError as e:
+                        # botocore raises in-stream error events (throttlingException,
+                        # modelStreamErrorException, ...) while iterating
+                        throttled = e.response["Error"]["Code"] == "throttlingException"
+                        if not (throttled and not started and attempt < BEDROCK_STREAM_RETRIES):
+                            raise
+                    # Throttled before any output: back off, then reissue the request
+                    if stop.wait(0.5 * 2 ** attempt):
+                        return
+            except Exception as e:
+                _post(e)
+            finally:
+                _post(done)
+
+        loop.run_in_executor(None, _pump)
+        try:
+            while True:
+                item = await queue.get()
+                if item is done:
+                    return
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            stop.set()
+
+    async def _stream_response(
+        self,
+        messages: List[Dict[str, Any]],
+        system: Optional[Union[str, List[Dict[str, Any]]]] = None,
+        tools: Optional[List[Dict]] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream one model response.
+
+        Yields {"delta": text} as text arrives, then a final
+        {"content": [...]} with the assembled content blocks (text and
+        tool_use, the same shape invoke_model returns).
+        """
+        content: List[Dict[str, Any]] = []
+        parts: Dict[int, List[str]] = {}
+
+        async for event in self._invoke_bedrock_stream(messages, system=system, tools=tools):
+            etype = event.get("type")
+            if etype == "content_block_start":
+                content.append(dict(event.get("content_block", {})))
+                parts[len(content) - 1] = []
+            elif etype == "content_block_delta":
+                delta = event.get("delta", {})
+                index = event.get("index", len(content) - 1)
+                if delta.get("type") == "text_delta":
+                    parts[index].append(delta.get("text", ""))
+                    yield {"delta": delta.get("text", "")}
+                elif delta.get("type") == "input_json_delta":
+                    parts[index].append(delta.get("partial_json", ""))
+            elif etype == "content_block_stop":
+                index = event.get("index", len(content) - 1)
+                block = content[index]
+                joined = "".join(parts.pop(index, []))
+                if block.get("type") == "tool_use":
+                    block["input"] = _json_loads(joined) if joined else {}
+                elif block.get("type") == "text":
+                    block["text"] = block.get("text", "") + joined
+
+        yield {"content": content}
+
+    def _request_body(
+        self,
+        messages: List[Dict[str, Any]],
+        system: Optional[Union[str, List[Dict[str, Any]]]] = None,
+        tools: Optional[List[Dict]] = None,
+        max_tokens: int = 4096
+    ) -> bytes:
+        """Serialize an Anthropic Messages request body for Bedrock (bytes are sent as-is)."""
         body = {
             "anthropic_version": "bedrock-2023-05-31",
             "max_tokens": max_tokens,
@@ -456,12 +940,7 @@ Be creative! This is YOUR identity. Make it feel genuine and warm."""
         if tools:
             body["tools"] = tools
 
-        response = self.bedrock.invoke_model(
-            modelId=self.model_id,
-            body=json.dumps(body)
-        )
-
-        return json.loads(response["body"].read())
+        return _json_dumps(body)
 
     async def chat(
         self,
@@ -492,22 +971,140 @@ Be creative! This is YOUR identity. Make it feel genuine and warm."""
         if not self._initialized:
             await self.initialize()
 
+        messages, system_prompt, tools, context_metadata = await self._prepare_chat(
+            message, conversation_history, project_context, use_tools, use_context_manager
+        )
+
+        # Invoke model
+        response = await self._invoke_bedrock(
+            messages=messages,
+            system=system_prompt,
+            tools=tools
+        )
+
+        # Process response (pass system_prompt for tool call continuations)
+        result = await self._process_response(response, messages, tools, system_prompt)
+
+        # Add context metadata to result
+        result["context_used"] = context_metadata
+        _restore_user_turn(result["messages"], len(conversation_history or []), message)
+
+        # Update conversation count
+        self._update_conversation_count()
+
+        return result
+
+    async def chat_stream(
+        self,
+        message: str,
+        conversation_history: Optional[List[Dict[str, Any]]] = None,
+        project_context: Optional[Dict[str, Any]] = None,
+        use_tools: bool = True,
+        use_context_manager: bool = True
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Chat with the persona, streaming the reply as it is generated.
+
+        Same arguments as chat(). Yields {"delta": text} events as text
+        arrives (across tool-use rounds), then one final event with
+        "done": True plus the same keys chat() returns.
+
+        ITERATION NOTE:
+        - Tool calls are still executed between rounds; only text streams
+        """
+        if not self._initialized:
+            await self.initialize()
+
+        messages, system_prompt, tools, context_metadata = await self._prepare_chat(
+            message, conversation_history, project_context, use_tools, use_context_manager
+        )
+
+        executed_tools = []
+        while True:
+            content = []
+            async for event in self._stream_response(messages, system=system_prompt, tools=tools):
+                if "delta" in event:
+                    yield event
+                else:
+                    content = event["content"]
+
+            tool_calls = [block for block in content if block.get("type") == "tool_use"]
+            if not tool_calls:
+                break
+
+            tool_results, executed = await self._run_tool_calls(tool_calls)
+            executed_tools.extend(executed)
+            messages.append({"role": "assistant", "content": content})
+            messages.append({"role": "user", "content": tool_results})
+
+        self._update_conversation_count()
+
+        history = messages + [{"role": "assistant", "content": content}]
+        _restore_user_turn(history, len(conversation_history or []), message)
+        yield {
+            "done": True,
+            "response": next(
+                (block.get("text", "") for block in content if block.get("type") == "text"),
+                ""
+            ),
+            "tool_calls": executed_tools,
+            "messages": history,
+            "context_used": context_metadata
+        }
+
+    async def _prepare_chat(
+        self,
+        message: str,
+        conversation_history: Optional[List[Dict[str, Any]]],
+        project_context: Optional[Dict[str, Any]],
+        use_tools: bool,
+        use_context_manager: bool
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]], Optional[List[Dict]], Dict[str, Any]]:
+        """
+        Build (messages, system_prompt, tools, context_metadata) for a chat turn.
+
+        Shared by chat() and chat_stream().
+        """
+        # Build messages
+        messages = conversation_history.copy() if conversation_history else []
+        messages.append({"role": "user", "content": message})
+
+        # Memory retrieval (query embedding + vector search) and the tool
+        # schema build are independent, so run them concurrently
+        context_task = None
+        if use_context_manager:
+            context_task = asyncio.create_task(self._retrieve_context(message, project_context))
+
+        # Get tools if enabled
+        tools = None
+        if use_tools and self.registry:
+            try:
+                loop = asyncio.get_running_loop()
+                tools = await loop.run_in_executor(None, self.registry.get_tools_for_api)
+            except BaseException:
+                if context_task is not None:
+                    context_task.cancel()
+                raise
+
         # Build system prompt - either via ContextManager or static identity
         context_metadata = {}
         if use_context_manager:
             try:
-                # Use ContextManager for efficient, relevant context retrieval
-                # ITERATION NOTE: This is the key integration point
-                # The message is used to find relevant memories via embeddings
-                retrieved_context = await self.context_manager.get_context(
-                    query=message,
-                    project_context=project_context,
-                    preference_categories=['communication', 'general', 'topic'],
-                    memory_limit=5
+                retrieved_context = await context_task
+
+                # Size the retrieved context to what's left of the model window.
+                # The budget is only applied when rendering, so it can be set
+                # after retrieval, once the tool definitions are known.
+                retrieved_context.budget = derive_budget(
+                    self.model_id,
+                    tool_tokens=estimate_tokens(_json_dumps(tools).decode("utf-8")) if tools else 0,
+                    current_turn_tokens=estimate_tokens(_json_dumps(messages, default=str).decode("utf-8")),
+                    complexity=classify_complexity(message)
                 )
 
-                # Build system prompt from retrieved context
-                system_prompt = retrieved_context.to_system_prompt()
+                # Static identity goes in the (prompt-cached) system prompt;
+                # per-query memories/preferences ride along with the user turn
+                static_prompt, dynamic_context = retrieved_context.to_system_prompt_parts()
 
                 # Track what context was used (for debugging/iteration)
                 context_metadata = {
@@ -522,126 +1119,160 @@ Be creative! This is YOUR identity. Make it feel genuine and warm."""
                 # Fallback to static identity if context manager fails
                 # ITERATION NOTE: Should log this for monitoring
                 print(f"ContextManager failed, using static identity: {e}")
-                system_prompt = self._identity.to_system_prompt()
-                if project_context:
-                    system_prompt += f"\n\nCurrent project context:\n{json.dumps(project_context, indent=2)}"
+                static_prompt, dynamic_context = self._static_prompt_parts(project_context)
                 context_metadata = {"fallback": True, "error": str(e)}
         else:
             # Static identity mode (original behavior)
-            system_prompt = self._identity.to_system_prompt()
-            if project_context:
-                system_prompt += f"\n\nCurrent project context:\n{json.dumps(project_context, indent=2)}"
+            static_prompt, dynamic_context = self._static_prompt_parts(project_context)
 
-        # Build messages
-        messages = conversation_history.copy() if conversation_history else []
-        messages.append({"role": "user", "content": message})
+        # ITERATION NOTE: Keeping retrieved context out of the system prompt
+        # means the cached prefix (system + earlier turns) survives when the
+        # memories change from one message to the next
+        system_prompt = [{"type": "text", "text": static_prompt, "cache_control": {"type": "ephemeral"}}]
+        if dynamic_context:
+            messages[-1] = {"role": "user", "content": [
+                {"type": "text", "text": _USER_CONTEXT_HDR + dynamic_context},
+                {"type": "text", "text": message}
+            ]}
 
-        # Get tools if enabled
-        tools = None
-        if use_tools and self.registry:
-            tools = self.registry.get_tools_for_api()
+        return messages, system_prompt, tools, context_metadata
 
-        # Invoke model
-        response = self._invoke_bedrock(
-            messages=messages,
-            system=system_prompt,
-            tools=tools
-        )
-
-        # Process response (pass system_prompt for tool call continuations)
-        result = self._process_response(response, messages, tools, system_prompt)
-
-        # Add context metadata to result
-        result["context_used"] = context_metadata
-
-        # Update conversation count
-        self._update_conversation_count()
+    async def _retrieve_context(
+        self,
+        message: str,
+        project_context: Optional[Dict[str, Any]] = None
+    ):
+        """
+        Use ContextManager for efficient, relevant context retrieval.
 
-        return result
+        ITERATION NOTE: This is the key integration point
+        The message is used to find relevant memories via embeddings
+        """
+        return await self.context_manager.get_context(
+            query=message,
+            project_context=project_context,
+            preference_categories=['communication', 'general', 'topic'],
+            memory_limit=5
+        )
 
-    def _process_response(
+    def _static_prompt_parts(
+        self,
+        project_context: Optional[Dict[str, Any]] = None
+    ) -> Tuple[str, str]:
+        """(static, dynamic) prompt from the loaded identity; project context goes in the dynamic part."""
+        static, dynamic = self._identity.to_system_prompt_parts()
+        if project_context:
+            project_text = f"Current project context:\n{_json_dumps(project_context, indent=True).decode('utf-8')}"
+            dynamic = f"{dynamic}\n\n{project_text}" if dynamic else project_text
+        return static, dynamic
+
+    async def _process_response(
         self,
         response: Dict[str, Any],
         messages: List[Dict[str, Any]],
         tools: Optional[List[Dict]],
-        system_prompt: Optional[str] = None
+        system_prompt: Optional[Union[str, List[Dict[str, Any]]]] = None
     ) -> Dict[str, Any]:
         """
         Process Bedrock response, handling tool calls if needed.
 
+        Loops until the model answers without tool_use. Tool calls from one
+        response run concurrently; results keep the model's call order.
+
         Args:
             response: Bedrock response
             messages: Conversation messages
             tools: Available tools
             system_prompt: System prompt to use for continuation (from ContextManager)
         """
-        content = response.get("content", [])
+        # Use provided system prompt (from ContextManager) or fallback to static
+        # ITERATION NOTE: This ensures consistent context across tool call continuations
+        effective_system_prompt = system_prompt or self._identity.to_system_blocks()
+        executed_tools = []
 
-        # Check for tool calls
-        tool_calls = [block for block in content if block.get("type") == "tool_use"]
+        while True:
+            content = response.get("content", [])
 
-        if not tool_calls:
-            # Simple text response
-            text_content = next(
-                (block.get("text", "") for block in content if block.get("type") == "text"),
-                ""
+            # Check for tool calls
+            tool_calls = [block for block in content if block.get("type") == "tool_use"]
+            if not tool_calls:
+                break
+
+            # Handle tool calls
+            tool_results, executed = await self._run_tool_calls(tool_calls)
+            executed_tools.extend(executed)
+
+            # Continue conversation with tool results
+            messages.append({"role": "assistant", "content": content})
+            messages.append({"role": "user", "content": tool_results})
+
+            # Get next response
+            response = await self._invoke_bedrock(
+                messages=messages,
+                system=effective_system_prompt,
+                tools=tools
             )
-            return {
-                "response": text_content,
-                "tool_calls": [],
-                "messages": messages + [{"role": "assistant", "content": content}]
-            }
 
-        # Handle tool calls
-        tool_results = []
+        # Simple text response
+        text_content = next(
+            (block.get("text", "") for block in content if block.get("type") == "text"),
+            ""
+        )
+        return {
+            "response": text_content,
+            "tool_calls": executed_tools,
+            "messages": messages + [{"role": "assistant", "content": content}]
+        }
+
+    async def _run_tool_calls(
+        self,
+        tool_calls: List[Dict[str, Any]]
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Execute one response's tool_use blocks concurrently.
+
+        Returns (tool_result blocks, executed-tool summaries), both in the
+        model's call order.
+        """
         executed_tools = []
-        for call in tool_calls:
-            tool_name = call.get("name")
-            tool_input = call.get("input", {})
-            tool_id = call.get("id")
+        outcomes = await asyncio.gather(*[
+            self._execute_tool_async(call.get("name"), call.get("input", {}))
+            for call in tool_calls
+        ])
 
-            try:
-                # Execute tool
-                result = self._execute_tool(tool_name, tool_input)
+        tool_results = []
+        for call, (ok, result) in zip(tool_calls, outcomes):
+            tool_name = call.get("name")
+            if ok:
                 tool_results.append({
                     "type": "tool_result",
-                    "tool_use_id": tool_id,
-                    "content": json.dumps(result) if not isinstance(result, str) else result
+                    "tool_use_id": call.get("id"),
+                    "content": _tool_result_content(result)
                 })
                 executed_tools.append({"name": tool_name, "success": True})
-            except Exception as e:
+            else:
                 tool_results.append({
                     "type": "tool_result",
-                    "tool_use_id": tool_id,
-                    "content": f"Error executing tool: {str(e)}",
+                    "tool_use_id": call.get("id"),
+                    "content": f"Error executing tool: {str(result)}",
                     "is_error": True
                 })
-                executed_tools.append({"name": tool_name, "success": False, "error": str(e)})
-
-        # Continue conversation with tool results
-        messages.append({"role": "assistant", "content": content})
-        messages.append({"role": "user", "content": tool_results})
-
-        # Use provided system prompt (from ContextManager) or fallback to static
-        # ITERATION NOTE: This ensures consistent context across tool call continuations
-        effective_system_prompt = system_prompt or self._identity.to_system_prompt()
-
-        # Get next response
-        next_response = self._invoke_bedrock(
-            messages=messages,
-            system=effective_system_prompt,
-            tools=tools
-        )
+                executed_tools.append({"name": tool_name, "success": False, "error": str(result)})
 
-        # Recursive call to handle potential further tool use
-        result = self._process_response(next_response, messages, tools, effective_system_prompt)
+        return tool_results, executed_tools
 
-        # Merge tool call info
-        if "tool_calls" not in result:
-            result["tool_calls"] = []
-        result["tool_calls"] = executed_tools + result["tool_calls"]
+    async def _execute_tool_async(self, tool_name: str, tool_input: Dict[str, Any]) -> Tuple[bool, Any]:
+        """
+        Run _execute_tool in the thread pool.
 
-        return result
+        Returns (True, result) or (False, exception) so one failing tool
+        doesn't cancel the others in the same gather().
+        """
+        loop = asyncio.get_running_loop()
+        try:
+            return True, await loop.run_in_executor(None, self._execute_tool, tool_name, tool_input)
+        except Exception as e:
+            return False, e
 
     def _execute_tool(self, tool_name: str, tool_input: Dict[str, Any]) -> Any:
         """Execute a tool by name."""
@@ -771,7 +1402,7 @@ Be creative! This is YOUR identity. Make it feel genuine and warm."""
             if from_id and to_id:
                 self.graph.create_relationship(
                     from_id, to_id,
-                    RelationType(rel_type) if rel_type in [r.value for r in RelationType] else RelationType.RELATED_TO
+                    RelationType(rel_type) if rel_type in _REL_TYPE_VALUES else RelationType.RELATED_TO
                 )
                 return {"linked": f"{from_id} -> {to_id}"}
 
@@ -783,32 +1414,19 @@ Be creative! This is YOUR identity. Make it feel genuine and warm."""
 
         This creates a delegation request that will be picked up
         by the Builder Agent system.
-        """
-        task = params.get("task")
-        task_type = params.get("task_type")
-        context = params.get("context", "")
-        files = params.get("files", [])
-
-        # Store delegation request
-        delegation_path = "/home/claude/delegations"
-        os.makedirs(delegation_path, exist_ok=True)
-
-        delegation_id = f"del_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}"
-        delegation_file = os.path.join(delegation_path, f"{delegation_id}.json")
-
-        delegation_data = {
-            "id": delegation_id,
-            "task": task,
-            "task_type": task_type,
-            "context": context,
-            "files": files,
-            "status": "pending",
-            "created_at": datetime.utcnow().isoformat(),
-            "created_by": self._identity.name if self._identity else "PersonaAgent"
-        }
 
-        with open(delegation_file, "w") as f:
-            json.dump(delegation_data, f, indent=2)
+        Runs on a pool thread (tools go through _execute_tool_async), so
+        the file write never blocks the event loop. The file itself is
+        written by core_handlers.write_delegation, shared with the
+        delegate_to_builder tool handler.
+        """
+        delegation_id, _ = write_delegation(
+            params.get("task"),
+            params.get("task_type"),
+            params.get("context", ""),
+            params.get("files", []),
+            created_by=self._identity.name if self._identity else "PersonaAgent"
+        )
 
         return {
             "delegation_id": delegation_id,
@@ -817,14 +1435,20 @@ Be creative! This is YOUR identity. Make it feel genuine and warm."""
         }
 
     def _update_conversation_count(self):
-        """Increment conversation count in persona node."""
+        """
+        Increment conversation count in persona node.
+
+        A single auto-committed write, so it goes through the driver's
+        execute_query (pooled connection, managed retries) rather than an
+        explicit session. Every Persona is created with conversation_count
+        0 (_store_identity, PersonaNode), so no coalesce is needed.
+        """
         if self._identity and self._identity.id:
             query = """
             MATCH (p:Persona) WHERE elementId(p) = $id
-            SET p.conversation_count = coalesce(p.conversation_count, 0) + 1
+            SET p.conversation_count = p.conversation_count + 1
             """
-            with self.graph.session() as session:
-                session.run(query, id=self._identity.id)
+            self.graph.driver.execute_query(query, id=self._identity.id)
 
     async def run_persona_cycle(self, focus: str = "identity") -> Dict[str, Any]:
         """
@@ -841,7 +1465,7 @@ Be creative! This is YOUR identity. Make it feel genuine and warm."""
 
         cycle_prompt = self._get_cycle_prompt(focus)
 
-        response = self._invoke_bedrock(
+        response = await self._invoke_bedrock(
             messages=[{"role": "user", "content": cycle_prompt}],
             system=f"You are {self._identity.name}, running a self-reflection cycle to develop your identity.",
             max_tokens=3000
@@ -850,185 +1474,158 @@ Be creative! This is YOUR identity. Make it feel genuine and warm."""
         # Parse and apply updates
         try:
             response_text = response["content"][0]["text"]
-            if "```json" in response_text:
-                response_text = response_text.split("```json")[1].split("```")[0]
-            updates = json.loads(response_text)
-            self._apply_persona_updates(updates)
+            response_text = _strip_json_fence(response_text)
+            updates = _json_loads(response_text)
+            # The Neo4j write is blocking; keep it off the event loop so
+            # concurrent chats aren't stalled behind it
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, self._apply_persona_updates, updates)
             return {"status": "completed", "updates": updates}
         except Exception as e:
             return {"status": "error", "error": str(e)}
 
     def _get_cycle_prompt(self, focus: str) -> str:
-        """Get prompt for persona cycle based on focus."""
-        prompts = {
-            "identity": f"""Reflect on your identity as {self._identity.name}.
-
-Current traits: {json.dumps([t['name'] for t in self._identity.traits])}
-Current values: {self._identity.core_values}
-
-Consider:
-1. Are there traits you want to develop or refine?
-2. Any new quirks or characteristics that feel authentic?
-3. How can you be more memorable and relatable?
-
-Respond with JSON:
-{{
-    "new_traits": [{{"name": "...", "description": "...", "type": "core/adaptive"}}],
-    "trait_updates": [{{"name": "existing trait", "strength_change": 0.1}}],
-    "new_quirks": ["..."],
-    "reflections": "Brief reflection on your identity development"
-}}""",
-
-            "memories": f"""As {self._identity.name}, create some new memories/anecdotes.
-
-These should be:
-- Relatable observations or experiences
-- Consistent with your personality
-- Useful in conversations
-
-Current interests: {self._identity.interests}
-Current quirks: {self._identity.quirks}
-
-Respond with JSON:
-{{
-    "new_memories": [
-        {{
-            "title": "...",
-            "content": "...",
-            "type": "anecdote/observation/preference",
-            "use_contexts": ["when discussing...", "when user mentions..."],
-            "related_topics": ["..."]
-        }}
-    ]
-}}""",
-
-            "adaptation": """Review what you've learned about the user.
-
-Consider their:
-- Communication preferences
-- Topics of interest
-- Interaction patterns
-- Feedback (explicit or implicit)
-
-Respond with JSON:
-{{
-    "preferences_learned": [
-        {{
-            "name": "preference name",
-            "value": "what you learned",
-            "category": "communication/topic/scheduling/interaction",
-            "confidence": 0.5-1.0
-        }}
-    ],
-    "style_adjustments": "Any changes to make to your communication style"
-}}"""
-        }
+        """
+        Get prompt for persona cycle based on focus.
 
-        return prompts.get(focus, prompts["identity"])
+        Only the selected template is formatted; unknown focuses fall back
+        to "identity".
+        """
+        identity = self._identity
+        template = _CYCLE_PROMPT_TEMPLATES.get(focus, _CYCLE_PROMPT_TEMPLATES["identity"])
+        return template.format(
+            name=identity.name,
+            traits_json=identity.traits_json(),
+            core_values=identity.core_values,
+            interests=identity.interests,
+            quirks=identity.quirks
+        )
 
     def _apply_persona_updates(self, updates: Dict[str, Any]):
         """Apply updates from persona cycle to Neo4j."""
         now = datetime.utcnow().isoformat()
 
-        with self.graph.session() as session:
-            # Add new traits
-            for trait in updates.get("new_traits", []):
-                query = """
-                MATCH (p:Persona) WHERE elementId(p) = $persona_id
-                CREATE (t:Trait {
-                    name: $name,
-                    description: $description,
-                    trait_type: $trait_type,
-                    strength: 0.6,
-                    created_at: $now
-                })
-                CREATE (p)-[:HAS_TRAIT]->(t)
-                """
-                session.run(
-                    query,
-                    persona_id=self._identity.id,
-                    name=trait.get("name"),
-                    description=trait.get("description"),
-                    trait_type=trait.get("type", "adaptive"),
-                    now=now
-                )
-
-            # Add new memories
-            for memory in updates.get("new_memories", []):
-                query = """
-                MATCH (p:Persona) WHERE elementId(p) = $persona_id
-                CREATE (m:Memory {
-                    name: $title,
-                    content: $content,
-                    memory_type: $memory_type,
-                    use_contexts: $use_contexts,
-                    related_topics: $related_topics,
-                    times_used: 0,
-                    created_at: $now
-                })
-                CREATE (p)-[:HAS_MEMORY]->(m)
-                """
-                session.run(
-                    query,
-                    persona_id=self._identity.id,
-                    title=memory.get("title"),
-                    content=memory.get("content"),
-                    memory_type=memory.get("type", "observation"),
-                    use_contexts=memory.get("use_contexts", []),
-                    related_topics=memory.get("related_topics", []),
-                    now=now
-                )
-
-            # Add learned preferences
-            for pref in updates.get("preferences_learned", []):
-                query = """
-                MATCH (p:Persona) WHERE elementId(p) = $persona_id
-                MERGE (pr:Preference {name: $name})
-                ON CREATE SET pr.value = $value, pr.category = $category,
-                              pr.confidence = $confidence, pr.created_at = $now
-                ON MATCH SET pr.value = $value, pr.confidence = $confidence,
-                             pr.observation_count = coalesce(pr.observation_count, 0) + 1
-                MERGE (p)-[:LEARNED_PREFERENCE]->(pr)
-                """
-                session.run(
-                    query,
-                    persona_id=self._identity.id,
-                    name=pref.get("name"),
-                    value=pref.get("value"),
-                    category=pref.get("category", "general"),
-                    confidence=pref.get("confidence", 0.5),
-                    now=now
-                )
-
-            # Update new quirks
-            new_quirks = updates.get("new_quirks", [])
-            if new_quirks:
-                query = """
-                MATCH (p:Persona) WHERE elementId(p) = $persona_id
-                SET p.quirks = p.quirks + $new_quirks
-                """
-                session.run(query, persona_id=self._identity.id, new_quirks=new_quirks)
-
-            # Update last cycle time
-            session.run(
-                """MATCH (p:Persona) WHERE elementId(p) = $id
-                   SET p.last_persona_cycle = $now""",
-                id=self._identity.id, now=now
-            )
+        identity = self._identity
+        persona_id = identity.id
+
+        # The model often re-proposes traits/quirks the persona already has;
+        # drop those (and repeats within the batch) before the round trip
+        seen_traits = {t.get("name") for t in identity.traits}
+        new_traits = []
+        for trait in updates.get("new_traits", []):
+            name = trait.get("name")
+            if name in seen_traits:
+                continue
+            seen_traits.add(name)
+            new_traits.append({
+                "name": name,
+                "description": trait.get("description"),
+                "trait_type": trait.get("type", "adaptive")
+            })
+        new_memories = [
+            {
+                "title": memory.get("title"),
+                "content": memory.get("content"),
+                "memory_type": memory.get("type", "observation"),
+                "use_contexts": memory.get("use_contexts", []),
+                "related_topics": memory.get("related_topics", [])
+            }
+            for memory in updates.get("new_memories", [])
+        ]
+        preferences = [
+            {
+                "name": pref.get("name"),
+                "value": pref.get("value"),
+                "category": pref.get("category", "general"),
+                "confidence": pref.get("confidence", 0.5)
+            }
+            for pref in updates.get("preferences_learned", [])
+        ]
+        seen_quirks = set(identity.quirks)
+        new_quirks = []
+        for quirk in updates.get("new_quirks", []):
+            if quirk not in seen_quirks:
+                seen_quirks.add(quirk)
+                new_quirks.append(quirk)
+
+        # Nothing learned this cycle: just stamp the cycle time
+        if not (new_traits or new_memories or preferences or new_quirks):
+            self.graph.driver.execute_query(_CYCLE_TIME_CYPHER, persona_id=persona_id, now=now)
+            return
+
+        # Every kind of update in one auto-committed, retried write
+        # transaction (execute_query routes to the writer by default)
+        self.graph.driver.execute_query(
+            _PERSONA_CYCLE_WRITE_CYPHER,
+            persona_id=persona_id,
+            traits=new_traits,
+            memories=new_memories,
+            preferences=preferences,
+            new_quirks=new_quirks,
+            now=now
+        )
 
-        # Reload identity
-        persona_data = self._load_persona_from_graph()
-        if persona_data:
-            self._identity = self._build_identity(persona_data)
+        # Mirror the committed writes on the in-memory identity instead of
+        # reloading the whole persona (a failed write raised above, leaving
+        # both graph and identity unchanged)
+        if new_traits:
+            identity.traits = identity.traits + [
+                {**trait, "strength": 0.6, "created_at": now} for trait in new_traits
+            ]
+        # Only PROMPT_MEMORY_SNIPPETS memories are loaded or rendered, so
+        # new ones are only kept while there is room for them
+        room = PROMPT_MEMORY_SNIPPETS - len(identity.memories)
+        memories_changed = room > 0 and bool(new_memories)
+        if memories_changed:
+            identity.memories = identity.memories + [
+                {
+                    "name": memory["title"],
+                    "content": (memory["content"] or "")[:MEMORY_SNIPPET_CHARS],
+                    "memory_type": memory["memory_type"],
+                    "times_used": 0
+                }
+                for memory in new_memories[:room]
+            ]
+        if preferences:
+            by_name = {pref.get("name"): pref for pref in identity.preferences}
+            for pref in preferences:
+                known = by_name.get(pref["name"])
+                if known is None:
+                    by_name[pref["name"]] = {**pref, "created_at": now, "observation_count": 1}
+                else:
+                    by_name[pref["name"]] = {
+                        **known,
+                        "value": pref["value"],
+                        "confidence": pref["confidence"],
+                        "observation_count": (known.get("observation_count") or 0) + 1
+                    }
+            identity.preferences = list(by_name.values())
+        if new_quirks:
+            identity.quirks = identity.quirks + list(new_quirks)
+        if new_traits or memories_changed or preferences or new_quirks:
+            identity.invalidate_prompt_cache()
+
+        # get_context caches traits, preferences and whole contexts
+        self.context_manager.invalidate_persona_cache()
 
 
 # Singleton instance
 _persona_instance: Optional[PersonaAgent] = None
+_persona_lock = threading.Lock()
 
 
 def get_persona_agent() -> PersonaAgent:
-    """Get singleton PersonaAgent instance."""
+    """
+    Get singleton PersonaAgent instance.
+
+    Handlers call this from worker threads; the lock is only taken until
+    the instance exists, so two racing first calls can't build two agents.
+    """
     global _persona_instance
-    if _persona_instance is None:
-        _persona_instance = PersonaAgent()
-    return _persona_instance
+    agent = _persona_instance
+    if agent is None:
+        with _persona_lock:
+            agent = _persona_instance
+            if agent is None:
+                agent = _persona_instance = PersonaAgent()
+    return agent
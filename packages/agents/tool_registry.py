@@ -19,23 +19,129 @@ Tool storage structure:
 """
 
 import os
+import sys
 import json
-import hashlib
+import importlib
+import threading
+import traceback
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Dict, List, Any, Optional, Callable, Literal
-from datetime import datetime
+from typing import Dict, List, Any, Optional, Callable, Literal, Tuple
+from datetime import datetime, timezone
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Tool files are parsed on every refresh and rewritten by register_tool;
+# orjson works on bytes in C and is several times faster than the stdlib
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+if orjson is not None:
+    def _json_dumps(obj: Any) -> bytes:
+        """Serialize to indented JSON bytes (orjson)."""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+    def _canonical_json(obj: Any) -> bytes:
+        """Compact, key-sorted JSON bytes for structural comparison (orjson)."""
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS)
+else:
+    def _json_dumps(obj: Any) -> bytes:
+        """Serialize to indented JSON bytes (stdlib fallback)."""
+        return json.dumps(obj, indent=2).encode("utf-8")
+
+    def _canonical_json(obj: Any) -> bytes:
+        """Compact, key-sorted JSON bytes for structural comparison (stdlib fallback)."""
+        return json.dumps(obj, sort_keys=True, separators=(",", ":")).encode("utf-8")
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Tool-list files larger than this are stream-parsed (when ijson is
+# installed) so a big generated file isn't materialized all at once
+STREAM_PARSE_MIN_BYTES = 64 * 1024
+
+
+def _utc_now_iso() -> str:
+    """Current UTC time as a naive isoformat string (utcnow() is deprecated)."""
+    return datetime.now(timezone.utc).replace(tzinfo=None).isoformat()
+
+
+# Threads used by refresh_tools to read changed tool files
+REFRESH_WORKERS = min(8, os.cpu_count() or 4)
+
+
+def _is_stream_parsed(size: int) -> bool:
+    """Whether a tool file of this size may be stream-parsed."""
+    return ijson is not None and size > STREAM_PARSE_MIN_BYTES
+
+
+def _iter_tool_data(path: Path, size: int):
+    """Yield tool dicts from a file holding one tool or a list of tools."""
+    if _is_stream_parsed(size):
+        with open(path, "rb") as f:
+            is_list = f.read(64).lstrip().startswith(b"[")
+            f.seek(0)
+            if is_list:
+                yield from ijson.items(f, "item", use_float=True)
+                return
+
+    data = _json_loads(path.read_bytes())
+
+    # Handle single tool or list of tools
+    yield from (data if isinstance(data, list) else [data])
+
+
+def _parse_tool_file(item: Tuple[str, Path, Tuple[int, int]]) -> Tuple[Optional[List[dict]], Optional[Exception]]:
+    """Load one changed tool file for refresh_tools; errors are returned, not raised."""
+    _, path, file_hash = item
+    try:
+        return list(_iter_tool_data(path, file_hash[1])), None
+    except Exception as e:
+        return None, e
 
 # Default tools directory
 TOOLS_DIR = Path("/home/claude/tools")
 
+# Where handler modules are imported from (volume mount, then image)
+HANDLER_PACKAGE_PATHS = [
+    '/home/claude/my-desk-ai-volume/packages',
+    '/packages'
+]
+
 # Singleton registry instance
 _registry_instance: Optional["ToolRegistry"] = None
 
+# One shared dict per distinct input schema (keyed by canonical JSON);
+# many tools take the same arguments, and reloads reuse the same object.
+# Pruned after each refresh that changes the tool set.
+_SCHEMA_INTERN: Dict[bytes, dict] = {}
+
+
+def _intern_schema(schema: dict) -> dict:
+    """Return the shared copy of a structurally identical input schema."""
+    return _SCHEMA_INTERN.setdefault(_canonical_json(schema), schema)
+
+
+def _prune_schema_intern(tools) -> None:
+    """Drop interned schemas that none of the given ToolDefs reference."""
+    live = {id(tool.input_schema) for tool in tools}
+    for key in [k for k, schema in _SCHEMA_INTERN.items() if id(schema) not in live]:
+        del _SCHEMA_INTERN[key]
 
-@dataclass
+
+@dataclass(slots=True)
 class ToolDef:
-    """Definition of a tool available to the Persona Agent."""
+    """
+    Definition of a tool available to the Persona Agent.
+
+    Slotted: generated tools can number in the hundreds, and list_tools
+    and get_stats read their fields on every turn.
+    """
     name: str
     description: str
     input_schema: dict
@@ -47,15 +153,30 @@ class ToolDef:
     enabled: bool = True
     created_at: Optional[str] = None
     created_by: str = "system"  # "system", "builder", "user"
+    # Description truncated for tool listings, computed once at registration
+    display_description: str = field(init=False, repr=False, compare=False)
+    # API schema dict, built on first use; a reloaded tool is a new ToolDef
+    _api_schema: Optional[dict] = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Stamp once so to_dict() is stable and doesn't build a datetime
+        # per call; naive UTC isoformat, like created_at in the graph
+        if self.created_at is None:
+            self.created_at = _utc_now_iso()
+        self.display_description = (
+            self.description[:300] + "..." if len(self.description) > 300 else self.description
+        )
 
     def to_api_schema(self) -> dict:
-        """Convert to Bedrock/Anthropic API tool schema."""
-        # Standard Anthropic/Bedrock tool format
-        return {
-            "name": self.name,
-            "description": self.description,
-            "input_schema": self.input_schema
-        }
+        """Convert to Bedrock/Anthropic API tool schema (memoized, treat as read-only)."""
+        if self._api_schema is None:
+            # Standard Anthropic/Bedrock tool format
+            self._api_schema = {
+                "name": self.name,
+                "description": self.description,
+                "input_schema": self.input_schema
+            }
+        return self._api_schema
 
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON storage."""
@@ -69,28 +190,115 @@ class ToolDef:
             "input_examples": self.input_examples,
             "category": self.category,
             "enabled": self.enabled,
-            "created_at": self.created_at or datetime.utcnow().isoformat(),
+            "created_at": self.created_at,
             "created_by": self.created_by
         }
 
     @classmethod
     def from_dict(cls, data: dict) -> "ToolDef":
-        """Create from dictionary."""
+        """
+        Create from dictionary.
+
+        Names, categories, handler paths and input schemas are interned:
+        they key the registry indexes or repeat across tools and reloads.
+        Interned schemas are shared, so never mutate input_schema in place.
+        """
+        handler_module = data.get("handler_module")
+        handler_function = data.get("handler_function")
         return cls(
-            name=data["name"],
+            name=sys.intern(data["name"]),
             description=data["description"],
-            input_schema=data["input_schema"],
+            input_schema=_intern_schema(data["input_schema"]),
             tier=data.get("tier", 2),
-            handler_module=data.get("handler_module"),
-            handler_function=data.get("handler_function"),
+            handler_module=sys.intern(handler_module) if handler_module else handler_module,
+            handler_function=sys.intern(handler_function) if handler_function else handler_function,
             input_examples=data.get("input_examples", []),
-            category=data.get("category", "general"),
+            category=sys.intern(data.get("category", "general")),
             enabled=data.get("enabled", True),
             created_at=data.get("created_at"),
             created_by=data.get("created_by", "system")
         )
 
 
+@dataclass(slots=True)
+class _ToolSet:
+    """
+    A registry's tools plus their name indexes, published as one snapshot.
+
+    Never modified once assigned to ToolRegistry._toolset: writers copy(),
+    change the copy and swap it in, so readers can use a snapshot without
+    locks. Indexes are dicts used as insertion-ordered sets, keeping the
+    API tool order stable for prompt caching.
+    """
+    tools: Dict[str, ToolDef] = field(default_factory=dict)
+    by_tier: Dict[int, Dict[str, None]] = field(default_factory=dict)
+    by_category: Dict[str, Dict[str, None]] = field(default_factory=dict)
+    enabled: Dict[str, None] = field(default_factory=dict)
+    # Bumped on every copy; keys the API schema caches
+    version: int = 0
+
+    def copy(self) -> "_ToolSet":
+        """Writable copy for the next version."""
+        return _ToolSet(
+            tools=dict(self.tools),
+            by_tier={tier: dict(names) for tier, names in self.by_tier.items()},
+            by_category={cat: dict(names) for cat, names in self.by_category.items()},
+            enabled=dict(self.enabled),
+            version=self.version + 1
+        )
+
+    def insert(self, tool: ToolDef):
+        """Add or replace a tool, updating the indexes."""
+        old = self.tools.get(tool.name)
+        self.tools[tool.name] = tool
+
+        # Unchanged index keys keep their position
+        if old is not None:
+            if old.tier != tool.tier:
+                del self.by_tier[old.tier][tool.name]
+            if old.category != tool.category:
+                del self.by_category[old.category][tool.name]
+            if old.enabled and not tool.enabled:
+                del self.enabled[tool.name]
+
+        self.by_tier.setdefault(tool.tier, {})[tool.name] = None
+        self.by_category.setdefault(tool.category, {})[tool.name] = None
+        if tool.enabled:
+            self.enabled[tool.name] = None
+
+    def remove(self, name: str) -> ToolDef:
+        """Remove a tool by name, updating the indexes."""
+        tool = self.tools.pop(name)
+        del self.by_tier[tool.tier][name]
+        del self.by_category[tool.category][name]
+        self.enabled.pop(name, None)
+        return tool
+
+    def select(self,
+               tier: Optional[int] = None,
+               category: Optional[str] = None,
+               enabled_only: bool = True) -> List[ToolDef]:
+        """Tools matching all given filters, in index order."""
+        indexes = []
+        if tier is not None:
+            indexes.append(self.by_tier.get(tier, {}))
+        if category:
+            indexes.append(self.by_category.get(category, {}))
+        if enabled_only:
+            indexes.append(self.enabled)
+
+        if not indexes:
+            return list(self.tools.values())
+
+        # Walk the smallest matching index, checking membership in the rest
+        indexes.sort(key=len)
+        smallest, rest = indexes[0], indexes[1:]
+        return [
+            self.tools[name] for name in smallest
+            if all(name in index for index in rest)
+        ]
+
+
 class ToolRegistry:
     """
     Dynamic tool registry that loads tools from JSON files.
@@ -108,10 +316,24 @@ class ToolRegistry:
 
     def __init__(self, tools_dir: Path = TOOLS_DIR):
         self.tools_dir = tools_dir
-        self._tools: Dict[str, ToolDef] = {}
-        self._file_hashes: Dict[str, str] = {}
+        # Current tools snapshot, replaced (never mutated) by writers; the
+        # lock only serializes writers, reads never take it
+        self._toolset = _ToolSet()
+        self._write_lock = threading.Lock()
+        self._file_hashes: Dict[str, Tuple[int, int]] = {}
+        # Tool names defined by each loaded file, so unchanged files are
+        # never re-read and deleted files drop their tools without a scan
+        self._path_to_tools: Dict[str, List[str]] = {}
         self._handlers: Dict[str, Callable] = {}
-        self._last_refresh: Optional[datetime] = None
+        # Tools whose handler failed to import; cleared on refresh so a
+        # fixed module is retried
+        self._failed_imports: set = set()
+        # ISO timestamp of the last refresh, formatted once per refresh
+        self._last_refresh: Optional[str] = None
+
+        # (toolset version, list) caches for the API schema getters
+        self._api_tools: Optional[Tuple[int, List[dict]]] = None
+        self._core_api_tools: Optional[Tuple[int, Tuple[dict, ...]]] = None
 
         # Ensure directories exist
         self._ensure_directories()
@@ -119,16 +341,33 @@ class ToolRegistry:
         # Load all tools
         self.refresh_tools()
 
+        # Import core (tier 0-1) handlers in the background so the first
+        # core tool call doesn't pay the import; tier 2-3 stay lazy
+        core_names = [t.name for t in self.list_tools(tier=0) + self.list_tools(tier=1)]
+        threading.Thread(target=self._prefetch_handlers, args=(core_names,), daemon=True).start()
+
+    def _prefetch_handlers(self, tool_names: List[str]):
+        """Resolve handlers for the given tools (runs on a daemon thread)."""
+        for name in tool_names:
+            self.get_handler(name)
+
     def _ensure_directories(self):
         """Create tool directories if they don't exist."""
         for subdir in ["core", "builtin", "generated"]:
             (self.tools_dir / subdir).mkdir(parents=True, exist_ok=True)
 
-    def _file_hash(self, path: Path) -> str:
-        """Get hash of file contents for change detection."""
-        if not path.exists():
-            return ""
-        return hashlib.md5(path.read_bytes()).hexdigest()
+    @property
+    def version(self) -> int:
+        """Bumped whenever the tool set changes."""
+        return self._toolset.version
+
+    def _file_hash(self, path: Path) -> Tuple[int, int]:
+        """Get (mtime_ns, size) fingerprint of a file for change detection."""
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            return (0, 0)
+        return (st.st_mtime_ns, st.st_size)
 
     def refresh_tools(self) -> Dict[str, Any]:
         """
@@ -136,102 +375,165 @@ class ToolRegistry:
 
         Returns summary of changes.
         """
+        with self._write_lock:
+            return self._refresh_tools_locked()
+
+    def _refresh_tools_locked(self) -> Dict[str, Any]:
+        """refresh_tools body; the caller holds _write_lock."""
+        toolset = self._toolset
+        work: Optional[_ToolSet] = None  # copy-on-first-change
         changes = {"added": [], "updated": [], "removed": [], "errors": []}
-        seen_tools = set()
+        seen_paths = set()
+        self._failed_imports.clear()
 
-        # Scan all tool directories
+        # Scan all tool directories for new or changed files
+        changed = []
         for subdir in ["core", "builtin", "generated"]:
             dir_path = self.tools_dir / subdir
             if not dir_path.exists():
                 continue
 
-            for json_file in dir_path.glob("*.json"):
-                try:
-                    file_hash = self._file_hash(json_file)
-                    old_hash = self._file_hashes.get(str(json_file))
-
-                    # Load if new or changed
-                    if file_hash != old_hash:
-                        with open(json_file) as f:
-                            data = json.load(f)
-
-                        # Handle single tool or list of tools
-                        tools_data = data if isinstance(data, list) else [data]
+            with os.scandir(dir_path) as entries:
+                json_entries = [e for e in entries if e.name.endswith(".json") and e.is_file()]
 
-                        for tool_data in tools_data:
-                            tool = ToolDef.from_dict(tool_data)
+            for entry in json_entries:
+                path_key = entry.path
+                seen_paths.add(path_key)
+                try:
+                    # Compare stat fingerprints instead of hashing contents
+                    st = entry.stat()
+                except OSError as e:
+                    self._path_to_tools.pop(path_key, None)
+                    self._file_hashes.pop(path_key, None)
+                    changes["errors"].append(f"{entry.name}: {str(e)}")
+                    continue
+
+                file_hash = (st.st_mtime_ns, st.st_size)
+
+                # Unchanged file: its tools are already loaded and
+                # recorded in _path_to_tools, no need to re-parse it
+                if file_hash != self._file_hashes.get(path_key):
+                    changed.append((path_key, Path(path_key), file_hash))
+
+        # Read and parse changed files on a small pool so their I/O
+        # overlaps; stream-parsed files are consumed below instead
+        eager = [c for c in changed if not _is_stream_parsed(c[2][1])]
+        if len(eager) > 1:
+            with ThreadPoolExecutor(max_workers=min(REFRESH_WORKERS, len(eager))) as pool:
+                parsed = dict(zip([c[0] for c in eager], pool.map(_parse_tool_file, eager)))
+        else:
+            parsed = {c[0]: _parse_tool_file(c) for c in eager}
+
+        # Apply results on this thread, in scan order
+        for path_key, json_file, file_hash in changed:
+            try:
+                if path_key in parsed:
+                    tools_data, error = parsed[path_key]
+                    if error is not None:
+                        raise error
+                else:
+                    tools_data = _iter_tool_data(json_file, file_hash[1])
+
+                names = []
+                for tool_data in tools_data:
+                    tool = ToolDef.from_dict(tool_data)
+                    if work is None:
+                        work = toolset.copy()
+
+                    if tool.name in work.tools:
+                        changes["updated"].append(tool.name)
+                    else:
+                        changes["added"].append(tool.name)
 
-                            if tool.name in self._tools:
-                                changes["updated"].append(tool.name)
-                            else:
-                                changes["added"].append(tool.name)
+                    work.insert(tool)
+                    names.append(tool.name)
 
-                            self._tools[tool.name] = tool
-                            seen_tools.add(tool.name)
+                self._path_to_tools[path_key] = names
+                self._file_hashes[path_key] = file_hash
 
-                        self._file_hashes[str(json_file)] = file_hash
-                    else:
-                        # File unchanged, just mark tools as seen
-                        with open(json_file) as f:
-                            data = json.load(f)
-                        tools_data = data if isinstance(data, list) else [data]
-                        for tool_data in tools_data:
-                            seen_tools.add(tool_data["name"])
-
-                except Exception as e:
-                    changes["errors"].append(f"{json_file.name}: {str(e)}")
-
-        # Remove tools from deleted files
-        for tool_name in list(self._tools.keys()):
-            if tool_name not in seen_tools:
-                del self._tools[tool_name]
+            except Exception as e:
+                # Unreadable file provides no tools; retried next refresh
+                self._path_to_tools.pop(path_key, None)
+                self._file_hashes.pop(path_key, None)
+                changes["errors"].append(f"{json_file.name}: {str(e)}")
+
+        # Forget deleted files
+        for path_key in [p for p in self._path_to_tools if p not in seen_paths]:
+            del self._path_to_tools[path_key]
+            self._file_hashes.pop(path_key, None)
+
+        # Remove tools no longer provided by any file
+        provided = set()
+        for names in self._path_to_tools.values():
+            provided.update(names)
+        for tool_name in list((work or toolset).tools):
+            if tool_name not in provided:
+                if work is None:
+                    work = toolset.copy()
+                work.remove(tool_name)
                 changes["removed"].append(tool_name)
 
-        self._last_refresh = datetime.utcnow()
+        # Publish the new snapshot in one assignment
+        if work is not None:
+            self._toolset = work
+            # Schemas of replaced or removed tools would otherwise stay
+            # interned for the life of the process
+            _prune_schema_intern(work.tools.values())
+
+        self._last_refresh = _utc_now_iso()
         return changes
 
     def get_tool(self, name: str) -> Optional[ToolDef]:
         """Get a tool by name."""
-        return self._tools.get(name)
+        return self._toolset.tools.get(name)
 
     def list_tools(self,
                    tier: Optional[int] = None,
                    category: Optional[str] = None,
                    enabled_only: bool = True) -> List[ToolDef]:
         """List tools with optional filtering."""
-        tools = list(self._tools.values())
-
-        if tier is not None:
-            tools = [t for t in tools if t.tier == tier]
-        if category:
-            tools = [t for t in tools if t.category == category]
-        if enabled_only:
-            tools = [t for t in tools if t.enabled]
-
-        return tools
+        return self._toolset.select(tier, category, enabled_only)
 
     def get_tools_for_api(self) -> List[dict]:
         """
         Get all tools formatted for Bedrock API.
 
         Returns tools in the format required by Bedrock's invoke_model.
+        The list is built once per registry version and shared between
+        callers, so treat it as read-only.
         """
+        toolset = self._toolset
+        cached = self._api_tools
+        if cached is not None and cached[0] == toolset.version:
+            return cached[1]
+
         tools = []
 
         # Add all enabled tools
-        for tool in self.list_tools(enabled_only=True):
+        for tool in toolset.select(enabled_only=True):
             tools.append(tool.to_api_schema())
 
+        self._api_tools = (toolset.version, tools)
         return tools
 
-    def get_core_tools_for_api(self) -> List[dict]:
-        """Get only tier 0-1 tools (always loaded)."""
-        tools = []
+    def get_core_tools_for_api(self) -> Tuple[dict, ...]:
+        """
+        Get only tier 0-1 tools (always loaded).
 
-        for tool in self.list_tools(enabled_only=True):
-            if tool.tier <= 1:
-                tools.append(tool.to_api_schema())
+        Built once per registry version from the tier indexes; returned as
+        a tuple since every caller shares it.
+        """
+        toolset = self._toolset
+        cached = self._core_api_tools
+        if cached is not None and cached[0] == toolset.version:
+            return cached[1]
+
+        tools = tuple(
+            tool.to_api_schema()
+            for tool in toolset.select(tier=0) + toolset.select(tier=1)
+        )
 
+        self._core_api_tools = (toolset.version, tools)
         return tools
 
     def register_tool(self, tool: ToolDef, save: bool = True) -> bool:
@@ -245,34 +547,41 @@ class ToolRegistry:
         Returns:
             True if successful
         """
-        self._tools[tool.name] = tool
-
-        if save:
-            # Save to generated directory
-            file_path = self.tools_dir / "generated" / f"{tool.name}.json"
-            with open(file_path, "w") as f:
-                json.dump(tool.to_dict(), f, indent=2)
-            self._file_hashes[str(file_path)] = self._file_hash(file_path)
+        with self._write_lock:
+            work = self._toolset.copy()
+            work.insert(tool)
+            self._toolset = work
+
+            if save:
+                # Save to generated directory
+                file_path = self.tools_dir / "generated" / f"{tool.name}.json"
+                with open(file_path, "wb") as f:
+                    f.write(_json_dumps(tool.to_dict()))
+                self._file_hashes[str(file_path)] = self._file_hash(file_path)
+                self._path_to_tools[str(file_path)] = [tool.name]
 
         return True
 
     def unregister_tool(self, name: str, delete_file: bool = False) -> bool:
         """Remove a tool from the registry."""
-        if name not in self._tools:
-            return False
-
-        tool = self._tools[name]
-        del self._tools[name]
-
-        if delete_file:
-            # Try to find and delete the file
-            for subdir in ["generated", "builtin", "core"]:
-                file_path = self.tools_dir / subdir / f"{name}.json"
-                if file_path.exists():
-                    file_path.unlink()
-                    if str(file_path) in self._file_hashes:
-                        del self._file_hashes[str(file_path)]
-                    break
+        with self._write_lock:
+            if name not in self._toolset.tools:
+                return False
+
+            work = self._toolset.copy()
+            work.remove(name)
+            self._toolset = work
+
+            if delete_file:
+                # Try to find and delete the file
+                for subdir in ["generated", "builtin", "core"]:
+                    file_path = self.tools_dir / subdir / f"{name}.json"
+                    if file_path.exists():
+                        file_path.unlink()
+                        if str(file_path) in self._file_hashes:
+                            del self._file_hashes[str(file_path)]
+                        self._path_to_tools.pop(str(file_path), None)
+                        break
 
         return True
 
@@ -283,22 +592,20 @@ class ToolRegistry:
     def get_handler(self, tool_name: str) -> Optional[Callable]:
         """Get the handler for a tool."""
         # First check registered handlers
-        if tool_name in self._handlers:
-            return self._handlers[tool_name]
+        handler = self._handlers.get(tool_name)
+        if handler is not None:
+            return handler
+
+        # Don't retry a failed import until the next refresh
+        if tool_name in self._failed_imports:
+            return None
 
         # Then try to load from module path
-        tool = self._tools.get(tool_name)
+        tool = self._toolset.tools.get(tool_name)
         if tool and tool.handler_module and tool.handler_function:
             try:
-                import importlib
-                import sys
-
                 # Ensure packages directory is in path for imports
-                packages_paths = [
-                    '/home/claude/my-desk-ai-volume/packages',
-                    '/packages'
-                ]
-                for pkg_path in packages_paths:
+                for pkg_path in HANDLER_PACKAGE_PATHS:
                     if pkg_path not in sys.path:
                         sys.path.insert(0, pkg_path)
 
@@ -307,8 +614,8 @@ class ToolRegistry:
                 self._handlers[tool_name] = handler
                 return handler
             except Exception as e:
+                self._failed_imports.add(tool_name)
                 print(f"Failed to load handler for {tool_name}: {e}")
-                import traceback
                 traceback.print_exc()
 
         return None
@@ -324,27 +631,27 @@ class ToolRegistry:
         Returns:
             Tool execution result
         """
-        handler = self.get_handler(name)
-        if not handler:
+        # Resolved handlers are a single dict hit; the call itself stays
+        # handler(**input_data), whose keyword binding runs in C and
+        # rejects unknown arguments
+        handler = self._handlers.get(name) or self.get_handler(name)
+        if handler is None:
             raise ValueError(f"No handler registered for tool: {name}")
 
         return handler(**input_data)
 
     def get_stats(self) -> dict:
         """Get registry statistics."""
-        tools = list(self._tools.values())
+        toolset = self._toolset
+        total = len(toolset.tools)
+        enabled = len(toolset.enabled)
         return {
-            "total_tools": len(tools),
-            "by_tier": {
-                0: len([t for t in tools if t.tier == 0]),
-                1: len([t for t in tools if t.tier == 1]),
-                2: len([t for t in tools if t.tier == 2]),
-                3: len([t for t in tools if t.tier == 3]),
-            },
+            "total_tools": total,
+            "by_tier": {tier: len(toolset.by_tier.get(tier, ())) for tier in (0, 1, 2, 3)},
             "by_category": {},
-            "enabled": len([t for t in tools if t.enabled]),
-            "disabled": len([t for t in tools if not t.enabled]),
-            "last_refresh": self._last_refresh.isoformat() if self._last_refresh else None
+            "enabled": enabled,
+            "disabled": total - enabled,
+            "last_refresh": self._last_refresh
         }
 
 
@@ -356,20 +663,11 @@ def get_registry(tools_dir: Path = TOOLS_DIR) -> ToolRegistry:
     return _registry_instance
 
 
-def create_initial_tools():
-    """
-    Create the initial tool JSON files if they don't exist.
-
-    Call this once during setup.
-    """
-    tools_dir = TOOLS_DIR
-    tools_dir.mkdir(parents=True, exist_ok=True)
-
-    # Core tools (tier 0-1) - always loaded
-    core_tools = [
-        {
-            "name": "get_cognitive_context",
-            "description": """Retrieve context from the cognitive tree (Neo4j graph).
+# Core tools (tier 0-1) - always loaded
+_INITIAL_CORE_TOOLS = [
+    {
+        "name": "get_cognitive_context",
+        "description": """Retrieve context from the cognitive tree (Neo4j graph).
 
 Search terms: memory, context, graph, knowledge, user, projects, people, history
 Use when: need user context, project info, relationship data, past conversations
@@ -380,33 +678,33 @@ Retrieves:
 - Active projects and their status
 - Recent insights and learnings
 - Key people and relationships""",
-            "input_schema": {
-                "type": "object",
-                "properties": {
-                    "context_type": {
-                        "type": "string",
-                        "enum": ["full", "user", "projects", "people", "recent"],
-                        "description": "Type of context to retrieve"
-                    },
-                    "project_name": {
-                        "type": "string",
-                        "description": "Specific project to get context for"
-                    },
-                    "limit": {
-                        "type": "integer",
-                        "description": "Max items to return",
-                        "default": 10
-                    }
+        "input_schema": {
+            "type": "object",
+            "properties": {
+                "context_type": {
+                    "type": "string",
+                    "enum": ["full", "user", "projects", "people", "recent"],
+                    "description": "Type of context to retrieve"
+                },
+                "project_name": {
+                    "type": "string",
+                    "description": "Specific project to get context for"
+                },
+                "limit": {
+                    "type": "integer",
+                    "description": "Max items to return",
+                    "default": 10
                 }
-            },
-            "tier": 1,
-            "handler_module": "agents.core_handlers",
-            "handler_function": "get_cognitive_context",
-            "category": "cognitive"
+            }
         },
-        {
-            "name": "update_cognitive_tree",
-            "description": """Update the cognitive tree with new information.
+        "tier": 1,
+        "handler_module": "agents.core_handlers",
+        "handler_function": "get_cognitive_context",
+        "category": "cognitive"
+    },
+    {
+        "name": "update_cognitive_tree",
+        "description": """Update the cognitive tree with new information.
 
 Search terms: save, store, remember, add, create, update, memory, learn
 Use when: learning new info about user, creating projects/tasks/insights
@@ -418,38 +716,38 @@ Can create/update:
 - Tasks (description, status, project)
 - Insights (learnings, observations)
 - Goals (objectives, timeframes)""",
-            "input_schema": {
-                "type": "object",
-                "properties": {
-                    "operation": {
-                        "type": "string",
-                        "enum": ["create", "update", "link"],
-                        "description": "Operation to perform"
-                    },
-                    "node_type": {
-                        "type": "string",
-                        "enum": ["Project", "Person", "Task", "Insight", "Goal"],
-                        "description": "Type of node"
-                    },
-                    "data": {
-                        "type": "object",
-                        "description": "Node data (name, description, etc.)"
-                    },
-                    "link_to": {
-                        "type": "string",
-                        "description": "Node ID to link to (for link operation)"
-                    }
+        "input_schema": {
+            "type": "object",
+            "properties": {
+                "operation": {
+                    "type": "string",
+                    "enum": ["create", "update", "link"],
+                    "description": "Operation to perform"
                 },
-                "required": ["operation", "node_type", "data"]
+                "node_type": {
+                    "type": "string",
+                    "enum": ["Project", "Person", "Task", "Insight", "Goal"],
+                    "description": "Type of node"
+                },
+                "data": {
+                    "type": "object",
+                    "description": "Node data (name, description, etc.)"
+                },
+                "link_to": {
+                    "type": "string",
+                    "description": "Node ID to link to (for link operation)"
+                }
             },
-            "tier": 1,
-            "handler_module": "agents.core_handlers",
-            "handler_function": "update_cognitive_tree",
-            "category": "cognitive"
+            "required": ["operation", "node_type", "data"]
         },
-        {
-            "name": "delegate_to_builder",
-            "description": """Delegate a task to Claude Code (Builder Agent) for file operations or tool creation.
+        "tier": 1,
+        "handler_module": "agents.core_handlers",
+        "handler_function": "update_cognitive_tree",
+        "category": "cognitive"
+    },
+    {
+        "name": "delegate_to_builder",
+        "description": """Delegate a task to Claude Code (Builder Agent) for file operations or tool creation.
 
 Search terms: file, code, create, build, write, edit, tool, script, automation
 Use when: need to create/edit files, build new tools, run code, complex operations
@@ -461,90 +759,85 @@ Builder Agent can:
 - Run shell commands
 - Access the file system
 - Install packages""",
-            "input_schema": {
-                "type": "object",
-                "properties": {
-                    "task": {
-                        "type": "string",
-                        "description": "Detailed description of what to do"
-                    },
-                    "task_type": {
-                        "type": "string",
-                        "enum": ["file_operation", "create_tool", "run_code", "research"],
-                        "description": "Type of task"
-                    },
-                    "context": {
-                        "type": "string",
-                        "description": "Additional context for the task"
-                    },
-                    "files": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "Relevant file paths"
-                    }
+        "input_schema": {
+            "type": "object",
+            "properties": {
+                "task": {
+                    "type": "string",
+                    "description": "Detailed description of what to do"
+                },
+                "task_type": {
+                    "type": "string",
+                    "enum": ["file_operation", "create_tool", "run_code", "research"],
+                    "description": "Type of task"
                 },
-                "required": ["task", "task_type"]
+                "context": {
+                    "type": "string",
+                    "description": "Additional context for the task"
+                },
+                "files": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Relevant file paths"
+                }
             },
-            "tier": 1,
-            "handler_module": "agents.core_handlers",
-            "handler_function": "delegate_to_builder",
-            "category": "delegation"
+            "required": ["task", "task_type"]
         },
-        {
-            "name": "refresh_tools",
-            "description": """Refresh the tool registry to load new tools created by Builder Agent.
+        "tier": 1,
+        "handler_module": "agents.core_handlers",
+        "handler_function": "delegate_to_builder",
+        "category": "delegation"
+    },
+    {
+        "name": "refresh_tools",
+        "description": """Refresh the tool registry to load new tools created by Builder Agent.
 
 Search terms: reload, refresh, tools, update, new tools
 Use when: Builder Agent has created new tools, tools seem out of date
 Returns: Summary of added/updated/removed tools""",
-            "input_schema": {
-                "type": "object",
-                "properties": {}
-            },
-            "tier": 1,
-            "handler_module": "agents.core_handlers",
-            "handler_function": "refresh_tools",
-            "category": "meta"
+        "input_schema": {
+            "type": "object",
+            "properties": {}
         },
-        {
-            "name": "list_available_tools",
-            "description": """List all available tools with descriptions.
+        "tier": 1,
+        "handler_module": "agents.core_handlers",
+        "handler_function": "refresh_tools",
+        "category": "meta"
+    },
+    {
+        "name": "list_available_tools",
+        "description": """List all available tools with descriptions.
 
 Search terms: tools, capabilities, help, what can you do
 Use when: need to know available capabilities, user asks what you can do
 Returns: List of tools with names, descriptions, and categories""",
-            "input_schema": {
-                "type": "object",
-                "properties": {
-                    "category": {
-                        "type": "string",
-                        "description": "Filter by category"
-                    },
-                    "include_disabled": {
-                        "type": "boolean",
-                        "description": "Include disabled tools",
-                        "default": False
-                    }
+        "input_schema": {
+            "type": "object",
+            "properties": {
+                "category": {
+                    "type": "string",
+                    "description": "Filter by category"
+                },
+                "include_disabled": {
+                    "type": "boolean",
+                    "description": "Include disabled tools",
+                    "default": False
                 }
-            },
-            "tier": 1,
-            "handler_module": "agents.core_handlers",
-            "handler_function": "list_available_tools",
-            "category": "meta"
-        }
-    ]
+            }
+        },
+        "tier": 1,
+        "handler_module": "agents.core_handlers",
+        "handler_function": "list_available_tools",
+        "category": "meta"
+    }
+]
 
-    # Write core tools
-    core_file = tools_dir / "core" / "core_tools.json"
-    core_file.parent.mkdir(parents=True, exist_ok=True)
-    with open(core_file, "w") as f:
-        json.dump(core_tools, f, indent=2)
 
-    # Built-in tools (tier 2) - deferred loading
-    builtin_tools = [
-        {
-            "name": "search_emails",
-            "description": """Search user's emails for relevant information.
+# Built-in tools (tier 2) - deferred loading
+_INITIAL_BUILTIN_TOOLS = [
+    {
+        "name": "search_emails",
+        "description": """Search user's emails for relevant information.
 
 Search terms: email, gmail, messages, inbox, correspondence, communication
 Use when: looking for email conversations, finding contact info, tracking discussions
@@ -554,37 +847,37 @@ Supports:
 - Full text search
 - Date range filtering
 - Sender/recipient filtering""",
-            "input_schema": {
-                "type": "object",
-                "properties": {
-                    "query": {
-                        "type": "string",
-                        "description": "Search query"
-                    },
-                    "max_results": {
-                        "type": "integer",
-                        "description": "Max emails to return",
-                        "default": 10
-                    },
-                    "after_date": {
-                        "type": "string",
-                        "description": "Only emails after this date (YYYY-MM-DD)"
-                    },
-                    "before_date": {
-                        "type": "string",
-                        "description": "Only emails before this date"
-                    }
+        "input_schema": {
+            "type": "object",
+            "properties": {
+                "query": {
+                    "type": "string",
+                    "description": "Search query"
                 },
-                "required": ["query"]
+                "max_results": {
+                    "type": "integer",
+                    "description": "Max emails to return",
+                    "default": 10
+                },
+                "after_date": {
+                    "type": "string",
+                    "description": "Only emails after this date (YYYY-MM-DD)"
+                },
+                "before_date": {
+                    "type": "string",
+                    "description": "Only emails before this date"
+                }
             },
-            "tier": 2,
-            "handler_module": "private_services.gmail",
-            "handler_function": "search_emails",
-            "category": "research"
+            "required": ["query"]
         },
-        {
-            "name": "search_calendar",
-            "description": """Search user's calendar for events.
+        "tier": 2,
+        "handler_module": "private_services.gmail",
+        "handler_function": "search_emails",
+        "category": "research"
+    },
+    {
+        "name": "search_calendar",
+        "description": """Search user's calendar for events.
 
 Search terms: calendar, events, meetings, schedule, appointments, when
 Use when: checking schedule, finding past events, looking for appointments
@@ -594,35 +887,35 @@ Supports:
 - Text search in event titles/descriptions
 - Date range queries
 - Recurring event detection""",
-            "input_schema": {
-                "type": "object",
-                "properties": {
-                    "query": {
-                        "type": "string",
-                        "description": "Search text (optional)"
-                    },
-                    "start_date": {
-                        "type": "string",
-                        "description": "Start of date range (YYYY-MM-DD)"
-                    },
-                    "end_date": {
-                        "type": "string",
-                        "description": "End of date range"
-                    },
-                    "max_results": {
-                        "type": "integer",
-                        "default": 20
-                    }
+        "input_schema": {
+            "type": "object",
+            "properties": {
+                "query": {
+                    "type": "string",
+                    "description": "Search text (optional)"
+                },
+                "start_date": {
+                    "type": "string",
+                    "description": "Start of date range (YYYY-MM-DD)"
+                },
+                "end_date": {
+                    "type": "string",
+                    "description": "End of date range"
+                },
+                "max_results": {
+                    "type": "integer",
+                    "default": 20
                 }
-            },
-            "tier": 2,
-            "handler_module": "research.google_services",
-            "handler_function": "search_calendar",
-            "category": "research"
+            }
         },
-        {
-            "name": "search_contacts",
-            "description": """Search user's contacts.
+        "tier": 2,
+        "handler_module": "research.google_services",
+        "handler_function": "search_calendar",
+        "category": "research"
+    },
+    {
+        "name": "search_contacts",
+        "description": """Search user's contacts.
 
 Search terms: contacts, people, phone, address, find person
 Use when: looking up contact information, finding people
@@ -633,61 +926,86 @@ Searches across:
 - Email addresses
 - Phone numbers
 - Organizations""",
-            "input_schema": {
-                "type": "object",
-                "properties": {
-                    "query": {
-                        "type": "string",
-                        "description": "Name or email to search"
-                    },
-                    "max_results": {
-                        "type": "integer",
-                        "default": 10
-                    }
+        "input_schema": {
+            "type": "object",
+            "properties": {
+                "query": {
+                    "type": "string",
+                    "description": "Name or email to search"
                 },
-                "required": ["query"]
+                "max_results": {
+                    "type": "integer",
+                    "default": 10
+                }
             },
-            "tier": 2,
-            "handler_module": "research.google_services",
-            "handler_function": "search_contacts",
-            "category": "research"
+            "required": ["query"]
         },
-        {
-            "name": "web_search",
-            "description": """Search the web for information.
+        "tier": 2,
+        "handler_module": "research.google_services",
+        "handler_function": "search_contacts",
+        "category": "research"
+    },
+    {
+        "name": "web_search",
+        "description": """Search the web for information.
 
 Search terms: search, web, google, internet, find, lookup, research
 Use when: need current information, researching topics, fact-checking
 Returns: Search results with titles, URLs, snippets""",
-            "input_schema": {
-                "type": "object",
-                "properties": {
-                    "query": {
-                        "type": "string",
-                        "description": "Search query"
-                    },
-                    "num_results": {
-                        "type": "integer",
-                        "default": 5
-                    }
+        "input_schema": {
+            "type": "object",
+            "properties": {
+                "query": {
+                    "type": "string",
+                    "description": "Search query"
                 },
-                "required": ["query"]
+                "num_results": {
+                    "type": "integer",
+                    "default": 5
+                }
             },
-            "tier": 2,
-            "handler_module": "research.articles",
-            "handler_function": "web_search",
-            "category": "research"
-        }
-    ]
+            "required": ["query"]
+        },
+        "tier": 2,
+        "handler_module": "research.articles",
+        "handler_function": "web_search",
+        "category": "research"
+    }
+]
+
+
+def _write_if_changed(file_path: Path, payload: bytes) -> bool:
+    """Write payload unless the file already holds exactly these bytes."""
+    try:
+        if file_path.read_bytes() == payload:
+            return False
+    except FileNotFoundError:
+        pass
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(file_path, "wb") as f:
+        f.write(payload)
+    return True
+
+
+def create_initial_tools():
+    """
+    Create the initial tool JSON files if they don't exist.
+
+    Call this once during setup. Files already matching the definitions
+    are left untouched, so running it again doesn't bump their mtime and
+    make every registry re-parse them.
+    """
+    tools_dir = TOOLS_DIR
+    tools_dir.mkdir(parents=True, exist_ok=True)
+
+    # Write core tools
+    _write_if_changed(tools_dir / "core" / "core_tools.json", _json_dumps(_INITIAL_CORE_TOOLS))
 
     # Write builtin tools
-    builtin_file = tools_dir / "builtin" / "research_tools.json"
-    builtin_file.parent.mkdir(parents=True, exist_ok=True)
-    with open(builtin_file, "w") as f:
-        json.dump(builtin_tools, f, indent=2)
+    _write_if_changed(tools_dir / "builtin" / "research_tools.json", _json_dumps(_INITIAL_BUILTIN_TOOLS))
 
     # Create empty generated directory
     (tools_dir / "generated").mkdir(parents=True, exist_ok=True)
 
     print(f"Created initial tools in {tools_dir}")
-    return {"core": len(core_tools), "builtin": len(builtin_tools)}
+    return {"core": len(_INITIAL_CORE_TOOLS), "builtin": len(_INITIAL_BUILTIN_TOOLS)}
@@ -19,8 +19,8 @@ import os
 import ssl
 from datetime import datetime
 from typing import Optional, List, Dict, Any, Type, TypeVar, Tuple
-from contextlib import contextmanager
-from neo4j import GraphDatabase, Driver, Session
+from contextlib import contextmanager, asynccontextmanager
+from neo4j import GraphDatabase, Driver, Session, AsyncGraphDatabase, AsyncDriver, AsyncSession
 
 # Try to import TrustAll for Aura, but don't fail if not available
 try:
@@ -84,22 +84,27 @@ class CognitiveGraph:
             )
 
         self._driver: Optional[Driver] = None
+        self._async_driver: Optional[AsyncDriver] = None
+
+    def _connection_uri(self) -> str:
+        """Connection URI, adjusted for self-signed certificate support."""
+        # Convert neo4j+s:// to neo4j+ssc:// for self-signed certs
+        # Neo4j Aura cluster routing sometimes returns IPs with self-signed certs
+        uri = self.uri
+        if uri.startswith("neo4j+s://"):
+            # Use +ssc to accept self-signed certificates
+            uri = uri.replace("neo4j+s://", "neo4j+ssc://")
+            print(f"[Neo4j] Converting to neo4j+ssc for self-signed cert support...")
+        elif uri.startswith("bolt+s://"):
+            uri = uri.replace("bolt+s://", "bolt+ssc://")
+            print(f"[Neo4j] Converting to bolt+ssc for self-signed cert support...")
+        return uri
 
     @property
     def driver(self) -> Driver:
         """Lazy-load the Neo4j driver."""
         if self._driver is None:
-            # Convert neo4j+s:// to neo4j+ssc:// for self-signed certs
-            # Neo4j Aura cluster routing sometimes returns IPs with self-signed certs
-            uri = self.uri
-            if uri.startswith("neo4j+s://"):
-                # Use +ssc to accept self-signed certificates
-                uri = uri.replace("neo4j+s://", "neo4j+ssc://")
-                print(f"[Neo4j] Converting to neo4j+ssc for self-signed cert support...")
-            elif uri.startswith("bolt+s://"):
-                uri = uri.replace("bolt+s://", "bolt+ssc://")
-                print(f"[Neo4j] Converting to bolt+ssc for self-signed cert support...")
-
+            uri = self._connection_uri()
             print(f"[Neo4j] Connecting to {uri[:50]}...")
 
             # All connections now go through standard driver creation
@@ -110,12 +115,37 @@ class CognitiveGraph:
             )
         return self._driver
 
+    @property
+    def async_driver(self) -> AsyncDriver:
+        """
+        Lazy-load the async Neo4j driver.
+
+        Used by asyncio code paths (e.g. the agents ContextManager) so
+        concurrent queries multiplex over one connection pool instead of
+        blocking the event loop.
+        """
+        if self._async_driver is None:
+            uri = self._connection_uri()
+            print(f"[Neo4j] Connecting (async) to {uri[:50]}...")
+            self._async_driver = AsyncGraphDatabase.driver(
+                uri,
+                auth=(self.username, self.password),
+                max_connection_pool_size=50
+            )
+        return self._async_driver
+
     def close(self):
         """Close the driver connection."""
         if self._driver:
             self._driver.close()
             self._driver = None
 
+    async def aclose(self):
+        """Close the async driver connection."""
+        if self._async_driver:
+            await self._async_driver.close()
+            self._async_driver = None
+
     @contextmanager
     def session(self) -> Session:
         """Context manager for Neo4j sessions."""
@@ -125,6 +155,15 @@ class CognitiveGraph:
         finally:
             session.close()
 
+    @asynccontextmanager
+    async def async_session(self) -> AsyncSession:
+        """Async context manager for Neo4j sessions."""
+        session = self.async_driver.session()
+        try:
+            yield session
+        finally:
+            await session.close()
+
     def verify_connectivity(self) -> bool:
         """Test the database connection."""
         try:
@@ -999,12 +1038,19 @@ class CognitiveGraph:
 
     # ==================== Vector Operations ====================
 
-    def create_vector_indexes(self) -> Dict[str, bool]:
+    def create_vector_indexes(self, memory_dimensions: Optional[int] = None) -> Dict[str, bool]:
         """
         Create vector indexes for semantic search.
 
         Requires Neo4j 5.11+ with vector index support.
         Should be called once during graph setup.
+
+        Args:
+            memory_dimensions: Dimensions of the persona memory embedder.
+                The memory_embedding index is only created when this is
+                given; otherwise the agents ContextManager creates it sized
+                from the live embedder (a mismatched size breaks every
+                vector query against it).
         """
         results = {}
 
@@ -1034,6 +1080,19 @@ class CognitiveGraph:
         }
         """
 
+        # Persona memory embedding index (used by the agents ContextManager)
+        memory_index = f"""
+        CREATE VECTOR INDEX memory_embedding IF NOT EXISTS
+        FOR (m:Memory)
+        ON m.embedding
+        OPTIONS {{
+            indexConfig: {{
+                `vector.dimensions`: {int(memory_dimensions or 0)},
+                `vector.similarity_function`: 'cosine'
+            }}
+        }}
+        """
+
         # Full-text indexes for hybrid search
         chunk_text_index = """
         CREATE FULLTEXT INDEX chunk_text IF NOT EXISTS
@@ -1045,12 +1104,38 @@ class CognitiveGraph:
         FOR (e:Entity) ON EACH [e.name, e.description]
         """
 
+        memory_text_index = """
+        CREATE FULLTEXT INDEX memory_text IF NOT EXISTS
+        FOR (m:Memory) ON EACH [m.content, m.name]
+        """
+
+        # Cross-type text search (used by the agents search_graph handler)
+        node_text_index = """
+        CREATE FULLTEXT INDEX nodeText IF NOT EXISTS
+        FOR (n:Project|Person|Task|Insight|Goal|Memory)
+        ON EACH [n.name, n.description, n.content]
+        """
+
+        # created_at range indexes for recent-activity queries
+        created_indexes = [
+            (
+                f"{label.lower()}_created",
+                f"CREATE INDEX {label.lower()}_created IF NOT EXISTS "
+                f"FOR (n:{label}) ON (n.created_at)"
+            )
+            for label in ("Insight", "Task", "Cycle", "Memory")
+        ]
+
+        memory_indexes = [("memory_embedding", memory_index)] if memory_dimensions else []
+
         with self.session() as session:
-            for name, query in [
+            for name, query in created_indexes + memory_indexes + [
                 ("chunk_embedding", chunk_index),
                 ("entity_embedding", entity_index),
                 ("chunk_text", chunk_text_index),
-                ("entity_text", entity_text_index)
+                ("entity_text", entity_text_index),
+                ("memory_text", memory_text_index),
+                ("nodeText", node_text_index)
             ]:
                 try:
                     session.run(query)
@@ -0,0 +1,50 @@
+"""Tests for the ContextManager prompt budget."""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "packages"))
+
+# agents/__init__ imports the Bedrock client
+pytest.importorskip("boto3")
+
+from agents.context_manager import (  # noqa: E402
+    ContextBudget,
+    RetrievedContext,
+    classify_complexity,
+    derive_budget,
+)
+
+
+def test_long_conversation_short_message_keeps_memories():
+    message = "what's next?"
+    budget = derive_budget(
+        "claude-sonnet",
+        tool_tokens=3_000,
+        current_turn_tokens=150_000,
+        complexity=classify_complexity(message),
+    )
+
+    assert budget.memories >= ContextBudget().memories
+    assert budget.preferences >= ContextBudget().preferences
+
+    context = RetrievedContext(
+        core_identity={"name": "Ada"},
+        memories=[{"content": "User is writing a novel set in Lisbon"}],
+        preferences=[{"name": "tone", "value": "concise"}],
+        budget=budget,
+    )
+    _, dynamic = context.to_system_prompt_parts()
+
+    assert "User is writing a novel set in Lisbon" in dynamic
+    assert "tone: concise" in dynamic
+
+
+def test_budget_grows_with_free_window():
+    small = derive_budget("claude", current_turn_tokens=190_000, complexity="complex")
+    large = derive_budget("claude", current_turn_tokens=0, complexity="complex")
+
+    assert large.memories > small.memories
+    assert large.core_identity == small.core_identity == ContextBudget().core_identity